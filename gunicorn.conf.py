@@ -0,0 +1,42 @@
+# Configuration for serving the API with gunicorn (not part of the package dependencies, install it separately):
+#
+#   gunicorn api.swagger_api:app
+#
+# run from the root of the repository, gunicorn picks up this file automatically.
+import multiprocessing
+import os
+
+# the modules in src import each other as top level packages (e.g. 'from utils.logger import log')
+pythonpath = "src"
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:5000")
+
+# Import the app (and with it OR-Tools) once in the master process. The workers are forked afterward and share the
+# loaded modules instead of importing them again.
+preload_app = True
+
+# CP-SAT solves block inside the C++ extension, so gevent could not switch to other requests in the meantime.
+# Threads work, since CP-SAT releases the GIL while solving.
+worker_class = "gthread"
+workers = int(os.environ.get("GUNICORN_WORKERS", max(2, multiprocessing.cpu_count() // 2)))
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+
+# By default, every solve would use all cores (CPSAT_WORKERS=0). Give each worker process its share of the cores
+# instead, so that the workers do not compete for all cores at once. The threads of a worker share its cores: a single
+# request per worker solves with several search workers, while concurrent requests in the same worker oversubscribe
+# its share. That trade-off favors the latency of single requests over the throughput under full load.
+# With the default of one worker per two cores, every solve gets 2 search workers; run fewer workers (GUNICORN_WORKERS)
+# to give the solves of larger instances more cores.
+# The config is loaded before the app, so an explicitly set CPSAT_WORKERS still takes precedence.
+os.environ.setdefault("CPSAT_WORKERS", str(max(1, multiprocessing.cpu_count() // workers)))
+
+# solving larger instances can take minutes
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 600))
+
+
+def post_fork(server, worker):
+    # solve a trivial instance in every worker, so that the first request does not pay for loading OR-Tools.
+    # This is not done in the master, since the worker processes should not inherit the threads of the solvers.
+    from api.swagger_api import warm_up_solvers
+
+    warm_up_solvers()
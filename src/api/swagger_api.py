@@ -1,19 +1,545 @@
-import math
-
-from flask import Flask, request
-from flask_restx import Api, Resource, fields, reqparse
-import time
-from datetime import datetime
+import collections
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from http import HTTPStatus
+
+import fastjsonschema
+import numpy as np
+import orjson
+import pandas
+from flask import Flask, make_response, request
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import quote_etag
+from flask_restx import Api, Resource, fields
 import warnings
 
+from utils.logger import log
 from order_scheduling.cp_order_to_line import main
 from worker_allocation.cp_woker_allocation import main_allocation
 from worker_allocation.cp_woker_allocation import extend_line_allocation_with_geometry_and_required_workers
 
+
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Number of parallel search workers of both CP-SAT solvers. 0 (the default) lets CP-SAT use all available cores.
+CPSAT_WORKERS = int(os.environ.get("CPSAT_WORKERS", "0"))
+
+# Number of cores shared by the solves of a batch (see WorkerAssignmentBatch). Defaults to all cores.
+BATCH_CORES = int(os.environ.get("BATCH_CORES", "0")) or os.cpu_count() or 1
+
+# Number of responses kept by cache_response
+RESPONSE_CACHE_SIZE = 256
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Parse and serialize JSON with orjson instead of the stdlib json module."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def order_durations(molds: list[int], amounts: list[int], throughputs: list[int]) -> list[int]:
+    """
+    Calculate the production durations [h] of orders on lines in a single vectorized pass.
+
+    Parameters:
+    - molds (list of int): The mold of the order for each order/line combination.
+    - amounts (list of int): The amount of the order for each order/line combination.
+    - throughputs (list of int): The throughput of the line for the geometry of the order.
+
+    Returns:
+    - list of int: The durations '5 * mold + (15 + amount / throughput) / 60', rounded up.
+    """
+    molds = np.asarray(molds, dtype=np.int64)
+    amounts = np.asarray(amounts, dtype=np.int64)
+    throughputs = np.asarray(throughputs, dtype=np.int64)
+    # 5 * mold + (15 + amount / throughput) / 60 is equal to
+    # (300 * mold * throughput + 15 * throughput + amount) / (60 * throughput),
+    # which allows an exact integer ceil division without any float rounding
+    numerators = 300 * molds * throughputs + 15 * throughputs + amounts
+    denominators = 60 * throughputs
+    return (-(-numerators // denominators)).tolist()
+
+
+@lru_cache(maxsize=256)
+def _cached_order_to_line_solution(order_key: tuple, num_workers: int) -> pandas.DataFrame:
+    return main(order_list=[list(order) for order in order_key], num_workers=num_workers)
+
+
+def solve_order_to_line(order_list: list[list[tuple]], num_workers: int = CPSAT_WORKERS) -> pandas.DataFrame:
+    """
+    Solve the order to line allocation, reusing the solution of a previous request with the same order list.
+
+    Parameters:
+    - order_list (list of lists of tuples): The alternatives (duration [h], line_id, priority, due_date [h]) per order.
+    - num_workers (int): The number of parallel search workers of CP-SAT (0 for all cores).
+
+    Returns:
+    - pandas.DataFrame: A copy of the solution returned by main(), so callers can modify it freely.
+    """
+    order_key = tuple(tuple(tuple(alternative) for alternative in order) for order in order_list)
+    return _cached_order_to_line_solution(order_key, num_workers).copy()
+
+
+def build_order_list(data: dict) -> tuple[list[list[tuple]], dict[str, str], dict[str, str], dict[str, list[str]]]:
+    """
+    Transform the planning data of a request into the order list format of main() in cp_order_to_line.
+
+    Parameters:
+    - data (dict): The request body (see request_body_model).
+
+    Returns:
+    - list of lists of tuples: The alternatives (duration [h], line_id, priority, due_date [h]) of each order that
+      can be produced on any line.
+    - dict: Maps the line names of the solver ('Line i') to the lines of the request.
+    - dict: Maps the order names of the solver ('Order i') to the orders of the request.
+    - dict: Maps the order names of the solver ('Order i') to the geometries of the order.
+    """
+    start_time_timestamp = data.get('start_time_stamp')
+    log.debug("start_time_stamp: %s", start_time_timestamp)
+    # Accessing order_data
+    order_data = data.get('order-data')
+    log.debug("order-data: %s", order_data)
+    # order_dict to uniquely identify the order based on id
+    order_dict = {}
+    order_geometries = {}
+    temp = 0
+
+    geometry_line_mapping = data.get('geometry_line_mapping')
+    throughput_mapping_list = data.get('throughput_mapping')
+
+    init_line_list = {}
+    temp_line_list = {}
+    for tp in throughput_mapping_list:
+        if tp['line'] not in init_line_list:
+            init_line_list[tp['line']] = temp
+            temp_line_list['Line ' + str(temp)] = tp['line']
+            temp = temp + 1
+
+    # Collect the geometries of each unique order, in the order of their first appearance
+    for to in order_data:
+        if to['order'] not in order_dict:
+            order_dict[to['order']] = []
+            order_geometries[to['order']] = []
+        order_geometries[to['order']].append(to['geometry'])
+
+    # Use the geometry_line_mapping to identify the available lines for each geometry
+    lines_per_geometry = {}
+    for geometry in geometry_line_mapping:
+        line_list = lines_per_geometry.setdefault(geometry['geometry'], [])
+        line_list.append(geometry['main_line'])  # add the possible line for the geometry to the line list.
+        line_list.extend(geometry['alternative_lines'])
+
+    # Index the throughput mapping rows by geometry, keeping their order (and duplicate rows)
+    throughput_rows_per_geometry = {}
+    for throughput_mapping in throughput_mapping_list:
+        throughput_rows_per_geometry.setdefault(throughput_mapping['geometry'], []).append(throughput_mapping)
+
+    # The possible (line_id, throughput) combinations only depend on the geometry of an order, so they are collected
+    # once per geometry. They follow the order of the throughput mapping and a line that is listed several times for
+    # the geometry in the geometry_line_mapping yields several combinations.
+    alternatives_per_geometry = {}
+    for geometry in dict.fromkeys(order['geometry'] for order in order_data):
+        line_counts = collections.Counter("Line " + str(line) for line in lines_per_geometry.get(geometry, []))
+        geometry_alternatives = []
+        for throughput_mapping in throughput_rows_per_geometry.get(geometry, []):
+            count = line_counts[throughput_mapping['line']]
+            if not count:
+                continue
+            throughput = throughput_mapping['throughput']
+            if throughput == 0:
+                warnings.warn("Throughput adjusted to 300")
+                throughput = 300
+            geometry_alternatives.extend([(init_line_list[throughput_mapping['line']], throughput)] * count)
+        alternatives_per_geometry[geometry] = geometry_alternatives
+
+    # collect every possible (order, line) combination first and compute all durations in one go afterwards
+    alternatives = []  # (order, line_id, priority, due_date [h])
+    molds, amounts, throughputs = [], [], []
+    # Convert the deadlines of all orders into mins relative to start_time_stamp at once, rounded up
+    deadline_timestamps = np.fromiter((order["deadline"] for order in order_data), dtype=np.float64,
+                                      count=len(order_data))
+    due_dates = np.ceil((deadline_timestamps - start_time_timestamp) / 60).astype(np.int64).tolist()
+    for order, due_date in zip(order_data, due_dates):
+        priority = int(not order['priority'])
+        for line_id, throughput in alternatives_per_geometry[order['geometry']]:
+            alternatives.append((order['order'], line_id, priority, due_date))
+            molds.append(order['mold'])
+            amounts.append(order['amount'])
+            throughputs.append(throughput)
+
+    # add the entry (duration [h], line_id, priority, due_date [h]) to the order_dict for the given order
+    durations = order_durations(molds, amounts, throughputs)
+    for (order_id, line_id, priority, due_date), duration in zip(alternatives, durations):
+        order_dict[order_id].append((duration, line_id, priority, due_date))
+
+    # Store the values for each order in order_list like: (duration [h], line_id, priority, due_date [h])
+    # and map the orders in the format "Order i", where i is the index of the order in order_list.
+    # Orders without any possible line are left out, so they must not take up an index.
+    order_list = []
+    order_map = {}
+    order_details = {}
+    for order_id, order_alternatives in order_dict.items():
+        if not order_alternatives:
+            continue
+        order_val = 'Order ' + str(len(order_list))
+        order_map[order_val] = order_id
+        order_details[order_val] = order_geometries[order_id]
+        order_list.append(order_alternatives)
+
+    return order_list, temp_line_list, order_map, order_details
+
+
+@lru_cache(maxsize=64)
+def _cached_required_workers_mapping(geometry_workers: tuple, line_geometries: tuple) -> dict[str, dict[str, int]]:
+    geometry_worker_count = dict(geometry_workers)
+    required_workers_mapping = {}
+    for line, geometry in line_geometries:
+        # For each line we append geometry and required number of workers
+        required_workers_mapping.setdefault(line, {})[geometry] = geometry_worker_count[geometry]
+    # Map each line to the line names of the solver: Line 0, Line 1, Line 2 ....
+    return {"Line " + str(index): value for index, value in enumerate(required_workers_mapping.values())}
+
+
+def build_required_workers_mapping(geometry_line_mapping: list[dict],
+                                   throughput_mapping: list[dict]) -> dict[str, dict[str, int]]:
+    """
+    Map the lines to the required number of workers per geometry. Since these mappings rarely change between requests,
+    the result is cached and shared between requests, so it must not be modified.
+
+    Parameters:
+    - geometry_line_mapping (list of dicts): The geometry_line_mapping of the request.
+    - throughput_mapping (list of dicts): The throughput_mapping of the request.
+
+    Returns:
+    - dict: Maps the line names of the solver ('Line i') to the required number of workers per geometry
+      (see required_workers_mapping in cp_worker_allocation).
+    """
+    geometry_workers = tuple((items['geometry'], items['number_of_workers']) for items in geometry_line_mapping)
+    line_geometries = tuple((items['line'], items['geometry']) for items in throughput_mapping)
+    return _cached_required_workers_mapping(geometry_workers, line_geometries)
+
+
+def build_worker_specific_data(human_factor: list[dict]) -> tuple[dict[int, dict[str, dict]], dict[int, int]]:
+    """
+    Transform the human factors of a request into the worker_specific_data format of main_allocation().
+
+    Parameters:
+    - human_factor (list of dicts): The human_factor of the request.
+
+    Returns:
+    - dict: Maps the worker index to the "experience" "preference" "resilience" and "medical-condition" per geometry.
+    - dict: Maps the worker ids of the request to the worker index (starting at 1, in the order of first appearance).
+    """
+    # group the human factors by worker and geometry, a worker may be listed several times for the same geometry
+    worker_map = {}
+    factors_per_worker = {}
+    for factor in human_factor:
+        worker = int(factor['worker'])
+        if worker not in worker_map:
+            worker_map[worker] = len(worker_map) + 1
+            factors_per_worker[worker_map[worker]] = {}
+        factors_per_worker[worker_map[worker]].setdefault(factor['geometry'], []).append(factor)
+
+    worker_specific_data = {}
+    n_duplicates = 0
+    for worker_index, factors_per_geometry in factors_per_worker.items():
+        worker_specific_data[worker_index] = {}
+        for geometry, factors in factors_per_geometry.items():
+            # merge duplicate rows: average the scores, the worker is only medically fit if all rows say so
+            n_duplicates += len(factors) - 1
+            worker_specific_data[worker_index][geometry] = {
+                "experience": sum(factor['experience'] for factor in factors) / len(factors),
+                "preference": sum(factor['preference'] for factor in factors) / len(factors),
+                "resilience": sum(factor['resilience'] for factor in factors) / len(factors),
+                "medical-condition": all(factor['medical_condition'] for factor in factors)
+            }
+    if n_duplicates:
+        warnings.warn(f"Merged {n_duplicates} duplicate human factor rows of the same worker and geometry")
+    return worker_specific_data, worker_map
+
+
+def build_worker_availabilities(availabilities: list[dict], worker_map: dict[int, int]) -> list[dict]:
+    """
+    Transform the availabilities of a request into the worker_availabilities format of main_allocation().
+
+    Parameters:
+    - availabilities (list of dicts): The availabilities of the request.
+    - worker_map (dict): Maps the worker ids of the request to the worker index (see build_worker_specific_data).
+
+    Returns:
+    - list of dicts: The availability intervals (from [h], end [h]) of each worker.
+    """
+    # The from_time and end_time are relative to start_time_timestamp. Calculate them in hours for all availabilities
+    # at once, the start rounded down and the end rounded up, and ensure the values are natural numbers
+    from_timestamps = np.fromiter((a["from_timestamp"] for a in availabilities), dtype=np.float64,
+                                  count=len(availabilities))
+    end_timestamps = np.fromiter((a["end_timestamp"] for a in availabilities), dtype=np.float64,
+                                 count=len(availabilities))
+    from_relative = np.maximum(np.floor(from_timestamps / 3600), 0).astype(np.int64).tolist()
+    end_relative = np.maximum(np.ceil(end_timestamps / 3600), 0).astype(np.int64).tolist()
+
+    # Transform the worker availabilities into tuple format, grouped by worker
+    availabilities_per_worker = {}
+    for availability, from_hour, end_hour in zip(availabilities, from_relative, end_relative):
+        # Extract worker ID (format "<id>" or "worker <id>") and look up the index of the worker
+        worker_index = worker_map[int(availability["worker"].rsplit(None, 1)[-1])]
+        availabilities_per_worker.setdefault(worker_index, []).append((from_hour, end_hour))
+    return [
+        {"Worker_id": worker_index, "availability": intervals}
+        for worker_index, intervals in availabilities_per_worker.items()
+    ]
+
+
+def worker_assignment(data: dict, num_workers: int = CPSAT_WORKERS) -> dict:
+    """
+    Allocate the orders of a request to the lines and assign the workers to the lines.
+
+    Parameters:
+    - data (dict): The request body (see request_body_model).
+    - num_workers (int): The number of parallel search workers of both CP-SAT solvers (0 for all cores).
+
+    Returns:
+    - dict: The response body (see worker_assignment_response_model).
+    """
+    # bind the sections of the request body once, they are used several times below
+    geometry_line_mapping = data.get('geometry_line_mapping')
+    throughput_mapping = data.get('throughput_mapping')
+    human_factor = data.get('human_factor')
+    availabilities = data.get('availabilities')
+
+    order_list, line_names, order_names, order_details = build_order_list(data)
+
+    # Replace the hard coded EXAMPLE_ORDER_INSTANCE with the order list generated in the previous step
+    # and call the function main() from cp_order_to_line (cached for identical order lists)
+    solution_df = solve_order_to_line(order_list, num_workers)
+    log.debug("order-to-line solution:\n%s", solution_df.head(n=30))
+    columns = solution_df.columns.tolist()
+    solution_dict = [dict(zip(columns, row)) for row in solution_df.itertuples(index=False, name=None)]
+
+    # Number the workers in the order of their first appearance and collect their human factors per geometry
+    worker_specific_data, worker_map = build_worker_specific_data(human_factor)
+
+    log.debug("order_list: %s", order_list)
+
+    # Create the required_workers_mapping by mapping the Line with geometry and required number of workers
+    # (see required_workers_mapping in cp_worker_allocation)
+    required_workers_mapping = build_required_workers_mapping(
+        geometry_line_mapping, throughput_mapping)
+
+    # Retrieve the worker availabilities in hours, grouped by worker
+    worker_availabilities = build_worker_availabilities(availabilities, worker_map)
+
+    # For each task (Order) in the result obtained from order_to_line, we add the list of possible geometries
+    # see hardcoded order_details in cp_worker_allocation.py for more information
+    line_allocation = []
+    for order in solution_dict:
+        geo_list = order_details[order['Task']]
+        for geo in geo_list:
+            try:
+                required_workers = required_workers_mapping[order['Resource']][geo]
+            except KeyError:
+                # Handle missing key, e.g., skip or log an error
+                continue
+            if required_workers:
+                # every geometry gets its own entry, so that the entries do not share (and overwrite) one dict
+                line_allocation.append({**order, 'geometry': geo, 'required_workers': required_workers})
+
+    #    order['required_workers'] = required_workers_mapping[order['Resource']][order['geometry']]
+    # line_allocation_with_geometry_and_required_workers = extend_line_allocation_with_geometry_and_required_workers(
+    #    order_to_line
+
+    # We perform the worker_allocation by running the solver
+    allocation_list = main_allocation(
+        line_data=line_allocation,
+        worker_specific_data=worker_specific_data,
+        worker_availabilities=worker_availabilities,
+        num_workers=num_workers)
+
+    # Extract the results and convert into the desired output format in a single pass: add the assigned workers
+    # and map the line and order names of the solvers back to the names of the request
+    final_result = [
+        {
+            **items,
+            'Resource': line_names.get(items['Resource'], items['Resource']),
+            'Task': order_names.get(items['Task'], items['Task']),
+            'workers': list(allocation_list.get(items['Resource'], [])),
+        }
+        for items in line_allocation
+    ]
+
+    message = "Successfully performed worker allocation operation."
+    if len(line_allocation) == 0:
+        message = "No Optimal / Feasible solution found!!"
+
+    return {
+        "message": message,
+        "solution": final_result  # Final result
+    }
+
+
+def order_to_line(data: dict, num_workers: int = CPSAT_WORKERS) -> dict:
+    """
+    Allocate the orders of a request to the lines.
+
+    Parameters:
+    - data (dict): The request body (see request_body_model).
+    - num_workers (int): The number of parallel search workers of CP-SAT (0 for all cores).
+
+    Returns:
+    - dict: The response body (see order_to_line_response_model).
+    """
+    order_list, line_names, order_names, _ = build_order_list(data)
+
+    # Replace the hard coded EXAMPLE_ORDER_INSTANCE with the order list generated in the previous step
+    # and call the function main() from cp_order_to_line (cached for identical order lists)
+    solution_df = solve_order_to_line(order_list, num_workers)
+    log.debug("order-to-line solution:\n%s", solution_df.head(n=30))
+    columns = solution_df.columns.tolist()
+    solution_dict = [dict(zip(columns, row)) for row in solution_df.itertuples(index=False, name=None)]
+
+    # map the line and order names of the solver back to the names of the request
+    final_result = [
+        {
+            **solution,
+            'Resource': line_names.get(solution['Resource'], solution['Resource']),
+            'Task': order_names.get(solution['Task'], solution['Task']),
+        }
+        for solution in solution_dict
+    ]
+    log.debug("order_list: %s", order_list)
+    return {
+        "message": "Successfully performed order-to-line operation.",
+        "solution": final_result  # Include solution_dict in the response
+    }
+
+
+_response_cache = collections.OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def request_digest(handler_name: str, data: dict) -> bytes:
+    """
+    Hash a request body in a normalized form.
+
+    Parameters:
+    - handler_name (str): The name of the function that processes the request.
+    - data (dict): The request body.
+
+    Returns:
+    - bytes: A BLAKE2b digest that is equal for requests to the same handler with the same content.
+    """
+    body = orjson.dumps(data, option=ORJSON_OPTIONS | orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(handler_name.encode() + b'\0' + body, digest_size=16).digest()
+
+
+def cached_response(handler, data: dict, num_workers: int = CPSAT_WORKERS) -> tuple[dict, str]:
+    """
+    Process a request with the given handler, reusing the response of a previous request with the same content.
+    The least recently used responses are evicted once more than RESPONSE_CACHE_SIZE are stored.
+
+    Parameters:
+    - handler (function): The function that processes the request, e.g. worker_assignment or order_to_line.
+    - data (dict): The request body.
+    - num_workers (int): The number of parallel search workers of CP-SAT for the handler (0 for all cores).
+
+    Returns:
+    - dict: The response body. It is shared between requests, so it must not be modified.
+    - str: The ETag of the response body, a digest of its content.
+    """
+    key = request_digest(handler.__name__, data)
+    with _response_cache_lock:
+        if key in _response_cache:
+            _response_cache.move_to_end(key)
+            return _response_cache[key]
+    response = handler(data, num_workers=num_workers)
+    etag = hashlib.blake2b(orjson.dumps(response, option=ORJSON_OPTIONS), digest_size=16).hexdigest()
+    with _response_cache_lock:
+        _response_cache[key] = response, etag
+        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+    return response, etag
+
+
+def conditional_response(response: dict, etag: str):
+    """
+    Answer with 304 Not Modified if the client already has the response (If-None-Match header), so that the response
+    body does not need to be serialized and sent again. Otherwise, answer with the response and its ETag.
+
+    Parameters:
+    - response (dict): The response body.
+    - etag (str): The ETag of the response body (see cached_response).
+
+    Returns:
+    - flask.Response or tuple: The empty 304 response, or the (body, status, headers) tuple for flask-restx.
+    """
+    # If-None-Match uses the weak comparison (RFC 7232), proxies that compress the response mark its ETag as weak
+    if request.if_none_match.contains_weak(etag):
+        not_modified = make_response('', HTTPStatus.NOT_MODIFIED)
+        not_modified.set_etag(etag)
+        return not_modified
+    return response, 200, {'ETag': quote_etag(etag)}
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 api = Api(app, version="1.0.0", title="Example API",
           description="API documentation for processing planning data, with each field as a parameter.")
 
+
+@api.representation('application/json')
+def output_json(data, code, headers=None):
+    """Serialize the responses of all resources with orjson instead of the stdlib json encoder of flask-restx."""
+    response = make_response(orjson.dumps(data, option=ORJSON_OPTIONS), code)
+    response.headers.extend(headers or {})
+    return response
+
+
+@lru_cache(maxsize=1)
+def swagger_etag() -> str:
+    """
+    Compute the ETag of the Swagger specification. flask-restx builds the specification once and it does not change
+    while the app is running, so the ETag is computed only once as well.
+
+    Returns:
+    - str: A digest of the Swagger specification.
+    """
+    return hashlib.blake2b(orjson.dumps(api.__schema__, option=ORJSON_OPTIONS), digest_size=16).hexdigest()
+
+
+@app.before_request
+def swagger_json_not_modified():
+    """
+    Answer with an empty 304 Not Modified if the client (e.g. the Swagger UI) already has the Swagger specification,
+    before the specification is serialized again.
+    """
+    # weak comparison, like for the responses of the solvers (see conditional_response)
+    if request.endpoint == 'specs' and request.if_none_match.contains_weak(swagger_etag()):
+        return make_response('', HTTPStatus.NOT_MODIFIED, {'ETag': quote_etag(swagger_etag())})
+    return None
+
+
+@app.after_request
+def swagger_json_etag(response):
+    """
+    Add the ETag to the Swagger specification, so that clients can revalidate it (see swagger_json_not_modified).
+    """
+    if request.endpoint == 'specs' and response.status_code == 200:
+        response.set_etag(swagger_etag())
+    return response
+
+
+# Example request body shown in the Swagger UI, kept in a JSON file next to this module instead of the source code
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'swagger_examples.json'), 'rb') as examples_file:
+    SWAGGER_EXAMPLES = orjson.loads(examples_file.read())
+
 # Define the models for complex parameter types with example values to tell the user about the input type
 order_data_model = api.model('OrderData', {
     'order': fields.String(required=True, example="example order 1", description="Order identifier"),
@@ -68,7803 +594,167 @@ request_body_model = api.model('WorkerAssignmentRequest', {
                                            description="Start time of the planning window in Unix timestamp format."),
     'order-data': fields.List(fields.Nested(order_data_model), required=True,
                               description="List of orders with their details.",
-                              example=[
-        {
-            "order": "SEV - 35",
-            "geometry": "1340746080/8080",
-            "amount": 4120,
-            "deadline": 1693605540.0,
-            "mold": 4,
-            "priority": False
-        },
-        {
-            "order": "SEV - 35",
-            "geometry": "468634640",
-            "amount": 450,
-            "deadline": 1693605540.0,
-            "mold": 6,
-            "priority": False
-        },
-        {
-            "order": "CAS - 35",
-            "geometry": "505469840/505518110",
-            "amount": 1165,
-            "deadline": 1693605540.0,
-            "mold": 5,
-            "priority": False
-        },
-        {
-            "order": "SEV - 36",
-            "geometry": "1344640080/4711080",
-            "amount": 9890,
-            "deadline": 1694210340.0,
-            "mold": 5,
-            "priority": False
-        },
-        {
-            "order": "SEV - 36",
-            "geometry": "533908540",
-            "amount": 6800,
-            "deadline": 1694210340.0,
-            "mold": 6,
-            "priority": False
-        },
-        {
-            "order": "MIR - 36",
-            "geometry": "521392800/970",
-            "amount": 2610,
-            "deadline": 1694210340.0,
-            "mold": 5,
-            "priority": False
-        },
-        {
-            "order": "SEV - 36",
-            "geometry": "1340750080",
-            "amount": 11750,
-            "deadline": 1694210340.0,
-            "mold": 6,
-            "priority": False
-        },
-        {
-            "order": "SEV - 36",
-            "geometry": "1342266080",
-            "amount": 3070,
-            "deadline": 1694210340.0,
-            "mold": 6,
-            "priority": False
-        },
-        {
-            "order": "SEV - 36",
-            "geometry": "501527470",
-            "amount": 4250,
-            "deadline": 1694210340.0,
-            "mold": 6,
-            "priority": False
-        },
-        {
-            "order": "SEV - 36",
-            "geometry": "1343314080",
-            "amount": 2940,
-            "deadline": 1694210340.0,
-            "mold": 5,
-            "priority": False
-        },
-        {
-            "order": "SEV - 36",
-            "geometry": "531359140",
-            "amount": 2600,
-            "deadline": 1694210340.0,
-            "mold": 5,
-            "priority": False
-        },
-        {
-            "order": "SEV - 36",
-            "geometry": "1343327080",
-            "amount": 3440,
-            "deadline": 1694210340.0,
-            "mold": 6,
-            "priority": False
-        },
-        {
-            "order": "SEV - 36",
-            "geometry": "534259180",
-            "amount": 5850,
-            "deadline": 1694210340.0,
-            "mold": 6,
-            "priority": False
-        },
-        {
-            "order": "SEV - 36",
-            "geometry": "534259080",
-            "amount": 6560,
-            "deadline": 1694210340.0,
-            "mold": 6,
-            "priority": False
-        },
-        {
-            "order": "MIR - 36",
-            "geometry": "522216940",
-            "amount": 2220,
-            "deadline": 1694210340.0,
-            "mold": 4,
-            "priority": False
-        },
-        {
-            "order": "MIR - 36",
-            "geometry": "521402240",
-            "amount": 1920,
-            "deadline": 1694210340.0,
-            "mold": 5,
-            "priority": False
-        },
-        {
-            "order": "SEV - 36",
-            "geometry": "1342236080",
-            "amount": 7350,
-            "deadline": 1694210340.0,
-            "mold": 4,
-            "priority": False
-        },
-        {
-            "order": "SEV - 36",
-            "geometry": "1342238080",
-            "amount": 2350,
-            "deadline": 1694210340.0,
-            "mold": 5,
-            "priority": False
-        },
-        {
-            "order": "SEV - 36",
-            "geometry": "1340746080/8080",
-            "amount": 6780,
-            "deadline": 1694210340.0,
-            "mold": 4,
-            "priority": False
-        },
-        {
-            "order": "SEV - 36",
-            "geometry": "468634640",
-            "amount": 9000,
-            "deadline": 1694210340.0,
-            "mold": 6,
-            "priority": False
-        },
-        {
-            "order": "SEV - 36",
-            "geometry": "531359170",
-            "amount": 4000,
-            "deadline": 1694210340.0,
-            "mold": 5,
-            "priority": False
-        },
-        {
-            "order": "CAS - 36",
-            "geometry": "505597580",
-            "amount": 1500,
-            "deadline": 1694210340.0,
-            "mold": 5,
-            "priority": False
-        }
-    ]),
+                              example=SWAGGER_EXAMPLES['order-data']),
     'geometry_line_mapping': fields.List(fields.Nested(geometry_line_mapping_model), required=True,
                                          description="Mapping of geometries to production lines.",
-                                         example=[
-        {
-            "geometry": "1340746080/8080",
-            "main_line": 17,
-            "alternative_lines": [],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "468634640",
-            "main_line": 20,
-            "alternative_lines": [
-                16,
-                21
-            ],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "505469840/505518110",
-            "main_line": 17,
-            "alternative_lines": [
-                18
-            ],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "main_line": 17,
-            "alternative_lines": [
-                3404
-            ],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "533908540",
-            "main_line": 24,
-            "alternative_lines": [
-                20
-            ],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "521392800/970",
-            "main_line": 17,
-            "alternative_lines": [
-                18
-            ],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "1340750080",
-            "main_line": 20,
-            "alternative_lines": [
-                24
-            ],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "1342266080",
-            "main_line": 20,
-            "alternative_lines": [],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "501527470",
-            "main_line": 24,
-            "alternative_lines": [
-                19
-            ],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "1343314080",
-            "main_line": 17,
-            "alternative_lines": [
-                19
-            ],
-            "number_of_workers": 6
-        },
-        {
-            "geometry": "531359140",
-            "main_line": 17,
-            "alternative_lines": [
-                18
-            ],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "1343327080",
-            "main_line": 20,
-            "alternative_lines": [],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "534259180",
-            "main_line": 24,
-            "alternative_lines": [
-                20
-            ],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "534259080",
-            "main_line": 24,
-            "alternative_lines": [
-                20
-            ],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "522216940",
-            "main_line": 17,
-            "alternative_lines": [
-                18
-            ],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "521402240",
-            "main_line": 17,
-            "alternative_lines": [
-                18
-            ],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "1342236080",
-            "main_line": 20,
-            "alternative_lines": [
-                16
-            ],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "1342238080",
-            "main_line": 20,
-            "alternative_lines": [
-                24
-            ],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "531359170",
-            "main_line": 24,
-            "alternative_lines": [
-                20
-            ],
-            "number_of_workers": 4
-        },
-        {
-            "geometry": "505597580",
-            "main_line": 24,
-            "alternative_lines": [],
-            "number_of_workers": 4
-        }
-    ]),
+                                         example=SWAGGER_EXAMPLES['geometry_line_mapping']),
     'throughput_mapping': fields.List(fields.Nested(throughput_mapping_model), required=True,
                                       description="List of throughput mappings for each line.",
-                                      example=[
-        {
-            "line": "Line 17",
-            "geometry": "1340746080/8080",
-            "throughput": 350
-        },
-        {
-            "line": "Line 20",
-            "geometry": "468634640",
-            "throughput": 0
-        },
-        {
-            "line": "Line 17",
-            "geometry": "505469840/505518110",
-            "throughput": 360
-        },
-        {
-            "line": "Line 17",
-            "geometry": "1344640080/4711080",
-            "throughput": 440
-        },
-        {
-            "line": "Line 24",
-            "geometry": "533908540",
-            "throughput": 540
-        },
-        {
-            "line": "Line 20",
-            "geometry": "521392800/970",
-            "throughput": 300
-        },
-        {
-            "line": "Line 20",
-            "geometry": "1340750080",
-            "throughput": 550
-        },
-        {
-            "line": "Line 24",
-            "geometry": "1340750080",
-            "throughput": 0
-        },
-        {
-            "line": "Line 20",
-            "geometry": "1342266080",
-            "throughput": 420
-        },
-        {
-            "line": "Line 24",
-            "geometry": "501527470",
-            "throughput": 540
-        },
-        {
-            "line": "Line 17",
-            "geometry": "1343314080",
-            "throughput": 323
-        },
-        {
-            "line": "Line 17",
-            "geometry": "531359140",
-            "throughput": 420
-        },
-        {
-            "line": "Line 20",
-            "geometry": "1343327080",
-            "throughput": 400
-        },
-        {
-            "line": "Line 24",
-            "geometry": "534259180",
-            "throughput": 550
-        },
-        {
-            "line": "Line 24",
-            "geometry": "534259080",
-            "throughput": 550
-        },
-        {
-            "line": "Line 17",
-            "geometry": "522216940",
-            "throughput": 300
-        },
-        {
-            "line": "Line 17",
-            "geometry": "521402240",
-            "throughput": 300
-        },
-        {
-            "line": "Line 20",
-            "geometry": "1342236080",
-            "throughput": 400
-        },
-        {
-            "line": "Line 20",
-            "geometry": "1342238080",
-            "throughput": 0
-        },
-        {
-            "line": "Line 24",
-            "geometry": "531359170",
-            "throughput": 0
-        },
-        {
-            "line": "Line 20",
-            "geometry": "531359170",
-            "throughput": 515
-        },
-        {
-            "line": "Line 24",
-            "geometry": "505597580",
-            "throughput": 380
-        }
-    ]),
+                                      example=SWAGGER_EXAMPLES['throughput_mapping']),
     'human_factor': fields.List(fields.Nested(human_factor_model), required=True,
                                 description="Human factor details for workers and geometries.",
-                                example=[
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.64,
-            "resilience": 0.03,
-            "medical_condition": True,
-            "experience": 0.22,
-            "worker": "15014209"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.74,
-            "resilience": 0.68,
-            "medical_condition": False,
-            "experience": 0.09,
-            "worker": "15014212"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.42,
-            "resilience": 0.03,
-            "medical_condition": True,
-            "experience": 0.51,
-            "worker": "15014727"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.03,
-            "resilience": 0.2,
-            "medical_condition": True,
-            "experience": 0.54,
-            "worker": "15014729"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.22,
-            "resilience": 0.59,
-            "medical_condition": True,
-            "experience": 0.01,
-            "worker": "15014964"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.81,
-            "resilience": 0.7,
-            "medical_condition": True,
-            "experience": 0.16,
-            "worker": "15015125"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.96,
-            "resilience": 0.34,
-            "medical_condition": True,
-            "experience": 0.1,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.85,
-            "resilience": 0.6,
-            "medical_condition": True,
-            "experience": 0.73,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.54,
-            "resilience": 0.97,
-            "medical_condition": True,
-            "experience": 0.55,
-            "worker": "15015264"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.83,
-            "resilience": 0.62,
-            "medical_condition": False,
-            "experience": 0.58,
-            "worker": "15015349"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.7,
-            "resilience": 0.05,
-            "medical_condition": True,
-            "experience": 0.29,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.08,
-            "resilience": 0.23,
-            "medical_condition": True,
-            "experience": 0.28,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.64,
-            "resilience": 0.36,
-            "medical_condition": True,
-            "experience": 0.21,
-            "worker": "15015514"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.27,
-            "resilience": 0.94,
-            "medical_condition": True,
-            "experience": 0.61,
-            "worker": "15015568"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.17,
-            "resilience": 0.73,
-            "medical_condition": True,
-            "experience": 0.38,
-            "worker": "15015650"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.99,
-            "resilience": 0.64,
-            "medical_condition": True,
-            "experience": 0.68,
-            "worker": "15015652"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.84,
-            "resilience": 0.78,
-            "medical_condition": True,
-            "experience": 0.03,
-            "worker": "15015653"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.32,
-            "resilience": 0.27,
-            "medical_condition": True,
-            "experience": 0.94,
-            "worker": "15004479"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.88,
-            "resilience": 0.31,
-            "medical_condition": True,
-            "experience": 0.4,
-            "worker": "15016112"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.91,
-            "resilience": 0.46,
-            "medical_condition": True,
-            "experience": 0.25,
-            "worker": "15016591"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.56,
-            "resilience": 0.26,
-            "medical_condition": True,
-            "experience": 0.9,
-            "worker": "15016633"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.4,
-            "resilience": 0.22,
-            "medical_condition": False,
-            "experience": 0.51,
-            "worker": "15017049"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.09,
-            "resilience": 0.05,
-            "medical_condition": True,
-            "experience": 0.63,
-            "worker": "15004696"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.79,
-            "resilience": 0.42,
-            "medical_condition": True,
-            "experience": 0.38,
-            "worker": "15009882"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 1.0,
-            "resilience": 0.53,
-            "medical_condition": False,
-            "experience": 0.86,
-            "worker": "15009935"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.01,
-            "resilience": 0.72,
-            "medical_condition": True,
-            "experience": 0.54,
-            "worker": "15040627"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.27,
-            "resilience": 0.64,
-            "medical_condition": True,
-            "experience": 0.43,
-            "worker": "15028961"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.45,
-            "resilience": 0.95,
-            "medical_condition": False,
-            "experience": 0.26,
-            "worker": "15028786"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.5,
-            "resilience": 0.18,
-            "medical_condition": False,
-            "experience": 0.87,
-            "worker": "15028790"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.3,
-            "resilience": 0.64,
-            "medical_condition": True,
-            "experience": 0.15,
-            "worker": "15028837"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.76,
-            "resilience": 0.54,
-            "medical_condition": True,
-            "experience": 0.53,
-            "worker": "15028914"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.0,
-            "resilience": 0.32,
-            "medical_condition": True,
-            "experience": 0.93,
-            "worker": "15097932"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.88,
-            "resilience": 0.83,
-            "medical_condition": True,
-            "experience": 0.06,
-            "worker": "15013130"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.88,
-            "resilience": 0.95,
-            "medical_condition": True,
-            "experience": 0.49,
-            "worker": "15013367"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.07,
-            "resilience": 0.76,
-            "medical_condition": True,
-            "experience": 0.13,
-            "worker": "15013533"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.48,
-            "resilience": 0.55,
-            "medical_condition": True,
-            "experience": 0.87,
-            "worker": "15013870"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.42,
-            "resilience": 0.21,
-            "medical_condition": True,
-            "experience": 0.73,
-            "worker": "15015510"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.2,
-            "resilience": 0.31,
-            "medical_condition": False,
-            "experience": 0.65,
-            "worker": "15015554"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.44,
-            "resilience": 0.52,
-            "medical_condition": True,
-            "experience": 0.22,
-            "worker": "15015610"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.34,
-            "resilience": 0.59,
-            "medical_condition": True,
-            "experience": 0.22,
-            "worker": "15017042"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.07,
-            "resilience": 0.63,
-            "medical_condition": True,
-            "experience": 0.91,
-            "worker": "15004666"
-        },
-        {
-            "geometry": "1340746080/8080",
-            "preference": 0.86,
-            "resilience": 0.07,
-            "medical_condition": True,
-            "experience": 0.67,
-            "worker": "15020309"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.21,
-            "resilience": 0.13,
-            "medical_condition": False,
-            "experience": 0.57,
-            "worker": "15014209"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.47,
-            "resilience": 0.78,
-            "medical_condition": True,
-            "experience": 0.19,
-            "worker": "15014212"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.1,
-            "resilience": 0.43,
-            "medical_condition": True,
-            "experience": 0.47,
-            "worker": "15014727"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.73,
-            "resilience": 0.67,
-            "medical_condition": False,
-            "experience": 0.1,
-            "worker": "15014729"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.4,
-            "resilience": 0.34,
-            "medical_condition": False,
-            "experience": 0.25,
-            "worker": "15014964"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.19,
-            "resilience": 0.45,
-            "medical_condition": True,
-            "experience": 0.28,
-            "worker": "15015125"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.25,
-            "resilience": 0.92,
-            "medical_condition": True,
-            "experience": 0.86,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.55,
-            "resilience": 0.05,
-            "medical_condition": False,
-            "experience": 0.84,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.97,
-            "resilience": 0.93,
-            "medical_condition": True,
-            "experience": 0.17,
-            "worker": "15015264"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.49,
-            "resilience": 0.21,
-            "medical_condition": True,
-            "experience": 0.06,
-            "worker": "15015349"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.38,
-            "resilience": 0.99,
-            "medical_condition": True,
-            "experience": 0.78,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.46,
-            "resilience": 0.42,
-            "medical_condition": False,
-            "experience": 1.0,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.56,
-            "resilience": 0.72,
-            "medical_condition": True,
-            "experience": 0.3,
-            "worker": "15015514"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.97,
-            "resilience": 0.58,
-            "medical_condition": True,
-            "experience": 0.75,
-            "worker": "15015568"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.06,
-            "resilience": 0.58,
-            "medical_condition": True,
-            "experience": 0.85,
-            "worker": "15015650"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.16,
-            "resilience": 0.96,
-            "medical_condition": True,
-            "experience": 0.19,
-            "worker": "15015652"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.6,
-            "resilience": 0.68,
-            "medical_condition": True,
-            "experience": 0.12,
-            "worker": "15015653"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.89,
-            "resilience": 0.25,
-            "medical_condition": True,
-            "experience": 0.62,
-            "worker": "15004479"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.42,
-            "resilience": 0.58,
-            "medical_condition": True,
-            "experience": 0.93,
-            "worker": "15016112"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.2,
-            "resilience": 0.72,
-            "medical_condition": True,
-            "experience": 0.4,
-            "worker": "15016591"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.67,
-            "resilience": 0.3,
-            "medical_condition": True,
-            "experience": 0.75,
-            "worker": "15016633"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.07,
-            "resilience": 0.46,
-            "medical_condition": False,
-            "experience": 1.0,
-            "worker": "15017049"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.07,
-            "resilience": 0.21,
-            "medical_condition": True,
-            "experience": 0.93,
-            "worker": "15004696"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.88,
-            "resilience": 0.88,
-            "medical_condition": True,
-            "experience": 0.16,
-            "worker": "15009882"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.83,
-            "resilience": 0.7,
-            "medical_condition": True,
-            "experience": 0.99,
-            "worker": "15009935"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.65,
-            "resilience": 0.01,
-            "medical_condition": True,
-            "experience": 0.3,
-            "worker": "15040627"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.66,
-            "resilience": 0.94,
-            "medical_condition": True,
-            "experience": 0.12,
-            "worker": "15028961"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.11,
-            "resilience": 0.55,
-            "medical_condition": True,
-            "experience": 0.6,
-            "worker": "15028786"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.72,
-            "resilience": 0.2,
-            "medical_condition": True,
-            "experience": 0.26,
-            "worker": "15028790"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.49,
-            "resilience": 0.91,
-            "medical_condition": True,
-            "experience": 0.09,
-            "worker": "15028837"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.42,
-            "resilience": 0.28,
-            "medical_condition": True,
-            "experience": 0.77,
-            "worker": "15028914"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.64,
-            "resilience": 0.26,
-            "medical_condition": True,
-            "experience": 0.55,
-            "worker": "15097932"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.43,
-            "resilience": 0.01,
-            "medical_condition": True,
-            "experience": 0.88,
-            "worker": "15013130"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.9,
-            "resilience": 0.55,
-            "medical_condition": True,
-            "experience": 0.58,
-            "worker": "15013367"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.15,
-            "resilience": 0.13,
-            "medical_condition": True,
-            "experience": 0.9,
-            "worker": "15013533"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.8,
-            "resilience": 0.86,
-            "medical_condition": False,
-            "experience": 0.21,
-            "worker": "15013870"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.25,
-            "resilience": 0.1,
-            "medical_condition": True,
-            "experience": 0.88,
-            "worker": "15015510"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.41,
-            "resilience": 0.62,
-            "medical_condition": True,
-            "experience": 0.93,
-            "worker": "15015554"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.86,
-            "resilience": 0.98,
-            "medical_condition": True,
-            "experience": 0.88,
-            "worker": "15015610"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.02,
-            "resilience": 0.74,
-            "medical_condition": True,
-            "experience": 0.93,
-            "worker": "15017042"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.8,
-            "resilience": 0.86,
-            "medical_condition": True,
-            "experience": 0.27,
-            "worker": "15004666"
-        },
-        {
-            "geometry": "468634640",
-            "preference": 0.79,
-            "resilience": 0.11,
-            "medical_condition": False,
-            "experience": 0.86,
-            "worker": "15020309"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.22,
-            "resilience": 0.82,
-            "medical_condition": True,
-            "experience": 0.31,
-            "worker": "15014209"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.8,
-            "resilience": 0.23,
-            "medical_condition": True,
-            "experience": 0.19,
-            "worker": "15014212"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.33,
-            "resilience": 0.86,
-            "medical_condition": False,
-            "experience": 0.28,
-            "worker": "15014727"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.64,
-            "resilience": 0.4,
-            "medical_condition": False,
-            "experience": 0.54,
-            "worker": "15014729"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.94,
-            "resilience": 0.12,
-            "medical_condition": False,
-            "experience": 0.18,
-            "worker": "15014964"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.96,
-            "resilience": 0.27,
-            "medical_condition": True,
-            "experience": 0.43,
-            "worker": "15015125"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.73,
-            "resilience": 0.31,
-            "medical_condition": True,
-            "experience": 0.51,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.39,
-            "resilience": 0.58,
-            "medical_condition": True,
-            "experience": 0.71,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.0,
-            "resilience": 0.93,
-            "medical_condition": True,
-            "experience": 0.72,
-            "worker": "15015264"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.74,
-            "resilience": 0.67,
-            "medical_condition": True,
-            "experience": 0.07,
-            "worker": "15015349"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.66,
-            "resilience": 0.33,
-            "medical_condition": True,
-            "experience": 0.85,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.72,
-            "resilience": 0.3,
-            "medical_condition": True,
-            "experience": 0.41,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.4,
-            "resilience": 0.3,
-            "medical_condition": True,
-            "experience": 0.42,
-            "worker": "15015514"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.94,
-            "resilience": 0.68,
-            "medical_condition": False,
-            "experience": 0.62,
-            "worker": "15015568"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.3,
-            "resilience": 0.55,
-            "medical_condition": True,
-            "experience": 0.29,
-            "worker": "15015650"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.43,
-            "resilience": 0.58,
-            "medical_condition": True,
-            "experience": 0.46,
-            "worker": "15015652"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.44,
-            "resilience": 0.21,
-            "medical_condition": True,
-            "experience": 0.9,
-            "worker": "15015653"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.8,
-            "resilience": 0.17,
-            "medical_condition": True,
-            "experience": 0.52,
-            "worker": "15004479"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.63,
-            "resilience": 0.34,
-            "medical_condition": True,
-            "experience": 0.75,
-            "worker": "15016112"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.67,
-            "resilience": 0.22,
-            "medical_condition": True,
-            "experience": 0.02,
-            "worker": "15016591"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.24,
-            "resilience": 0.48,
-            "medical_condition": True,
-            "experience": 0.07,
-            "worker": "15016633"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.41,
-            "resilience": 0.63,
-            "medical_condition": True,
-            "experience": 0.7,
-            "worker": "15017049"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.49,
-            "resilience": 0.24,
-            "medical_condition": True,
-            "experience": 0.01,
-            "worker": "15004696"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.75,
-            "resilience": 0.77,
-            "medical_condition": True,
-            "experience": 0.43,
-            "worker": "15009882"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.18,
-            "resilience": 0.96,
-            "medical_condition": True,
-            "experience": 0.05,
-            "worker": "15009935"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.25,
-            "resilience": 0.85,
-            "medical_condition": True,
-            "experience": 0.8,
-            "worker": "15040627"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.67,
-            "resilience": 0.99,
-            "medical_condition": True,
-            "experience": 0.95,
-            "worker": "15028961"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.89,
-            "resilience": 0.61,
-            "medical_condition": True,
-            "experience": 0.5,
-            "worker": "15028786"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.83,
-            "resilience": 0.55,
-            "medical_condition": False,
-            "experience": 0.74,
-            "worker": "15028790"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.47,
-            "resilience": 0.26,
-            "medical_condition": True,
-            "experience": 0.64,
-            "worker": "15028837"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.77,
-            "resilience": 0.52,
-            "medical_condition": True,
-            "experience": 0.27,
-            "worker": "15028914"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.08,
-            "resilience": 0.29,
-            "medical_condition": True,
-            "experience": 0.32,
-            "worker": "15097932"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.54,
-            "resilience": 0.14,
-            "medical_condition": True,
-            "experience": 0.69,
-            "worker": "15013130"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.71,
-            "resilience": 0.06,
-            "medical_condition": True,
-            "experience": 0.54,
-            "worker": "15013367"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.42,
-            "resilience": 0.21,
-            "medical_condition": True,
-            "experience": 0.9,
-            "worker": "15013533"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.58,
-            "resilience": 0.7,
-            "medical_condition": False,
-            "experience": 0.77,
-            "worker": "15013870"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.38,
-            "resilience": 0.01,
-            "medical_condition": True,
-            "experience": 0.75,
-            "worker": "15015510"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.85,
-            "resilience": 0.95,
-            "medical_condition": True,
-            "experience": 0.75,
-            "worker": "15015554"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.55,
-            "resilience": 0.6,
-            "medical_condition": True,
-            "experience": 0.22,
-            "worker": "15015610"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.44,
-            "resilience": 0.03,
-            "medical_condition": True,
-            "experience": 0.68,
-            "worker": "15017042"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.4,
-            "resilience": 0.17,
-            "medical_condition": True,
-            "experience": 0.13,
-            "worker": "15004666"
-        },
-        {
-            "geometry": "505469840/505518110",
-            "preference": 0.62,
-            "resilience": 0.03,
-            "medical_condition": True,
-            "experience": 0.56,
-            "worker": "15020309"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.03,
-            "resilience": 0.64,
-            "medical_condition": True,
-            "experience": 0.46,
-            "worker": "15014209"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.05,
-            "resilience": 0.38,
-            "medical_condition": True,
-            "experience": 0.33,
-            "worker": "15014212"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.76,
-            "resilience": 0.38,
-            "medical_condition": True,
-            "experience": 0.83,
-            "worker": "15014727"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.25,
-            "resilience": 0.08,
-            "medical_condition": True,
-            "experience": 0.54,
-            "worker": "15014729"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 1.0,
-            "resilience": 0.35,
-            "medical_condition": True,
-            "experience": 0.78,
-            "worker": "15014964"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.65,
-            "resilience": 0.75,
-            "medical_condition": False,
-            "experience": 0.2,
-            "worker": "15015125"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.02,
-            "resilience": 0.15,
-            "medical_condition": True,
-            "experience": 0.67,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.56,
-            "resilience": 0.22,
-            "medical_condition": True,
-            "experience": 0.77,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.17,
-            "resilience": 0.61,
-            "medical_condition": True,
-            "experience": 0.11,
-            "worker": "15015264"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.82,
-            "resilience": 0.96,
-            "medical_condition": True,
-            "experience": 0.03,
-            "worker": "15015349"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.31,
-            "resilience": 0.68,
-            "medical_condition": False,
-            "experience": 0.4,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.72,
-            "resilience": 0.08,
-            "medical_condition": True,
-            "experience": 0.63,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.1,
-            "resilience": 0.77,
-            "medical_condition": False,
-            "experience": 0.6,
-            "worker": "15015514"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.12,
-            "resilience": 0.98,
-            "medical_condition": True,
-            "experience": 0.35,
-            "worker": "15015568"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.43,
-            "resilience": 0.37,
-            "medical_condition": True,
-            "experience": 0.34,
-            "worker": "15015650"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.85,
-            "resilience": 0.82,
-            "medical_condition": True,
-            "experience": 0.96,
-            "worker": "15015652"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.64,
-            "resilience": 0.83,
-            "medical_condition": True,
-            "experience": 0.44,
-            "worker": "15015653"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.73,
-            "resilience": 0.97,
-            "medical_condition": True,
-            "experience": 0.81,
-            "worker": "15004479"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.54,
-            "resilience": 0.48,
-            "medical_condition": True,
-            "experience": 0.73,
-            "worker": "15016112"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.27,
-            "resilience": 0.85,
-            "medical_condition": True,
-            "experience": 0.09,
-            "worker": "15016591"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.88,
-            "resilience": 0.24,
-            "medical_condition": True,
-            "experience": 0.61,
-            "worker": "15016633"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.38,
-            "resilience": 0.03,
-            "medical_condition": False,
-            "experience": 0.18,
-            "worker": "15017049"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.21,
-            "resilience": 0.8,
-            "medical_condition": True,
-            "experience": 0.88,
-            "worker": "15004696"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.7,
-            "resilience": 0.28,
-            "medical_condition": True,
-            "experience": 0.95,
-            "worker": "15009882"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.09,
-            "resilience": 0.72,
-            "medical_condition": True,
-            "experience": 0.76,
-            "worker": "15009935"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.69,
-            "resilience": 0.65,
-            "medical_condition": True,
-            "experience": 0.79,
-            "worker": "15040627"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.09,
-            "resilience": 0.22,
-            "medical_condition": True,
-            "experience": 0.31,
-            "worker": "15028961"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.58,
-            "resilience": 0.47,
-            "medical_condition": True,
-            "experience": 0.43,
-            "worker": "15028786"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.75,
-            "resilience": 0.33,
-            "medical_condition": True,
-            "experience": 0.27,
-            "worker": "15028790"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.25,
-            "resilience": 0.12,
-            "medical_condition": True,
-            "experience": 0.12,
-            "worker": "15028837"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.54,
-            "resilience": 0.76,
-            "medical_condition": True,
-            "experience": 0.22,
-            "worker": "15028914"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.48,
-            "resilience": 0.72,
-            "medical_condition": False,
-            "experience": 0.52,
-            "worker": "15097932"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.28,
-            "resilience": 0.1,
-            "medical_condition": True,
-            "experience": 0.23,
-            "worker": "15013130"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.18,
-            "resilience": 0.01,
-            "medical_condition": True,
-            "experience": 0.27,
-            "worker": "15013367"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.97,
-            "resilience": 0.55,
-            "medical_condition": True,
-            "experience": 0.13,
-            "worker": "15013533"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.87,
-            "resilience": 0.49,
-            "medical_condition": False,
-            "experience": 0.57,
-            "worker": "15013870"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.47,
-            "resilience": 0.44,
-            "medical_condition": True,
-            "experience": 0.05,
-            "worker": "15015510"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.94,
-            "resilience": 0.48,
-            "medical_condition": True,
-            "experience": 0.4,
-            "worker": "15015554"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.07,
-            "resilience": 0.63,
-            "medical_condition": True,
-            "experience": 0.15,
-            "worker": "15015610"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.56,
-            "resilience": 0.3,
-            "medical_condition": False,
-            "experience": 0.12,
-            "worker": "15017042"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.76,
-            "resilience": 0.61,
-            "medical_condition": True,
-            "experience": 0.23,
-            "worker": "15004666"
-        },
-        {
-            "geometry": "1344640080/4711080",
-            "preference": 0.52,
-            "resilience": 0.45,
-            "medical_condition": True,
-            "experience": 0.86,
-            "worker": "15020309"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.99,
-            "resilience": 0.31,
-            "medical_condition": True,
-            "experience": 0.61,
-            "worker": "15014209"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.74,
-            "resilience": 0.95,
-            "medical_condition": True,
-            "experience": 0.21,
-            "worker": "15014212"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.66,
-            "resilience": 0.16,
-            "medical_condition": True,
-            "experience": 0.08,
-            "worker": "15014727"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.0,
-            "resilience": 0.45,
-            "medical_condition": True,
-            "experience": 0.29,
-            "worker": "15014729"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.23,
-            "resilience": 0.71,
-            "medical_condition": True,
-            "experience": 0.45,
-            "worker": "15014964"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.69,
-            "resilience": 0.92,
-            "medical_condition": True,
-            "experience": 0.63,
-            "worker": "15015125"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.66,
-            "resilience": 0.93,
-            "medical_condition": True,
-            "experience": 0.54,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.65,
-            "resilience": 0.91,
-            "medical_condition": True,
-            "experience": 0.07,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.17,
-            "resilience": 0.31,
-            "medical_condition": True,
-            "experience": 0.57,
-            "worker": "15015264"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.29,
-            "resilience": 0.12,
-            "medical_condition": True,
-            "experience": 0.7,
-            "worker": "15015349"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.94,
-            "resilience": 0.5,
-            "medical_condition": True,
-            "experience": 0.08,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.04,
-            "resilience": 0.43,
-            "medical_condition": True,
-            "experience": 0.25,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.09,
-            "resilience": 0.96,
-            "medical_condition": True,
-            "experience": 0.58,
-            "worker": "15015514"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.95,
-            "resilience": 1.0,
-            "medical_condition": True,
-            "experience": 0.27,
-            "worker": "15015568"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.04,
-            "resilience": 0.76,
-            "medical_condition": True,
-            "experience": 0.65,
-            "worker": "15015650"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.92,
-            "resilience": 0.18,
-            "medical_condition": True,
-            "experience": 0.63,
-            "worker": "15015652"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.49,
-            "resilience": 0.09,
-            "medical_condition": True,
-            "experience": 0.33,
-            "worker": "15015653"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.67,
-            "resilience": 0.86,
-            "medical_condition": True,
-            "experience": 0.69,
-            "worker": "15004479"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.29,
-            "resilience": 0.95,
-            "medical_condition": True,
-            "experience": 0.55,
-            "worker": "15016112"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.45,
-            "resilience": 0.31,
-            "medical_condition": True,
-            "experience": 0.97,
-            "worker": "15016591"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.4,
-            "resilience": 0.51,
-            "medical_condition": False,
-            "experience": 0.66,
-            "worker": "15016633"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.54,
-            "resilience": 0.41,
-            "medical_condition": True,
-            "experience": 0.36,
-            "worker": "15017049"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.76,
-            "resilience": 0.63,
-            "medical_condition": True,
-            "experience": 0.2,
-            "worker": "15004696"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.55,
-            "resilience": 0.93,
-            "medical_condition": True,
-            "experience": 0.7,
-            "worker": "15009882"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.12,
-            "resilience": 0.97,
-            "medical_condition": True,
-            "experience": 0.24,
-            "worker": "15009935"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.16,
-            "resilience": 0.55,
-            "medical_condition": True,
-            "experience": 0.09,
-            "worker": "15040627"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.99,
-            "resilience": 0.91,
-            "medical_condition": True,
-            "experience": 0.12,
-            "worker": "15028961"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.83,
-            "resilience": 0.5,
-            "medical_condition": True,
-            "experience": 0.51,
-            "worker": "15028786"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.27,
-            "resilience": 0.83,
-            "medical_condition": False,
-            "experience": 0.24,
-            "worker": "15028790"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.55,
-            "resilience": 0.38,
-            "medical_condition": False,
-            "experience": 0.51,
-            "worker": "15028837"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.88,
-            "resilience": 0.86,
-            "medical_condition": True,
-            "experience": 0.79,
-            "worker": "15028914"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.41,
-            "resilience": 0.93,
-            "medical_condition": True,
-            "experience": 0.82,
-            "worker": "15097932"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.28,
-            "resilience": 0.3,
-            "medical_condition": True,
-            "experience": 1.0,
-            "worker": "15013130"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.49,
-            "resilience": 0.15,
-            "medical_condition": True,
-            "experience": 0.35,
-            "worker": "15013367"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.55,
-            "resilience": 0.54,
-            "medical_condition": True,
-            "experience": 0.32,
-            "worker": "15013533"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.19,
-            "resilience": 0.7,
-            "medical_condition": True,
-            "experience": 0.23,
-            "worker": "15013870"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.78,
-            "resilience": 0.04,
-            "medical_condition": True,
-            "experience": 0.71,
-            "worker": "15015510"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.81,
-            "resilience": 0.39,
-            "medical_condition": True,
-            "experience": 0.82,
-            "worker": "15015554"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.98,
-            "resilience": 0.5,
-            "medical_condition": True,
-            "experience": 0.5,
-            "worker": "15015610"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.59,
-            "resilience": 0.87,
-            "medical_condition": False,
-            "experience": 0.44,
-            "worker": "15017042"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.53,
-            "resilience": 0.46,
-            "medical_condition": True,
-            "experience": 0.41,
-            "worker": "15004666"
-        },
-        {
-            "geometry": "533908540",
-            "preference": 0.65,
-            "resilience": 0.15,
-            "medical_condition": True,
-            "experience": 0.97,
-            "worker": "15020309"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.34,
-            "resilience": 0.69,
-            "medical_condition": True,
-            "experience": 0.85,
-            "worker": "15014209"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.85,
-            "resilience": 0.86,
-            "medical_condition": True,
-            "experience": 0.32,
-            "worker": "15014212"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.72,
-            "resilience": 0.76,
-            "medical_condition": False,
-            "experience": 0.04,
-            "worker": "15014727"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.07,
-            "resilience": 0.63,
-            "medical_condition": False,
-            "experience": 1.0,
-            "worker": "15014729"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.75,
-            "resilience": 0.43,
-            "medical_condition": True,
-            "experience": 0.63,
-            "worker": "15014964"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.87,
-            "resilience": 0.44,
-            "medical_condition": True,
-            "experience": 0.9,
-            "worker": "15015125"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.05,
-            "resilience": 0.8,
-            "medical_condition": True,
-            "experience": 0.37,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.15,
-            "resilience": 0.53,
-            "medical_condition": True,
-            "experience": 0.79,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.17,
-            "resilience": 0.08,
-            "medical_condition": False,
-            "experience": 0.62,
-            "worker": "15015264"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.24,
-            "resilience": 0.91,
-            "medical_condition": True,
-            "experience": 0.46,
-            "worker": "15015349"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.25,
-            "resilience": 0.26,
-            "medical_condition": True,
-            "experience": 0.8,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.9,
-            "resilience": 0.68,
-            "medical_condition": True,
-            "experience": 0.44,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.35,
-            "resilience": 0.59,
-            "medical_condition": True,
-            "experience": 0.42,
-            "worker": "15015514"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.25,
-            "resilience": 0.85,
-            "medical_condition": True,
-            "experience": 0.38,
-            "worker": "15015568"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.48,
-            "resilience": 0.24,
-            "medical_condition": True,
-            "experience": 0.57,
-            "worker": "15015650"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.99,
-            "resilience": 0.3,
-            "medical_condition": False,
-            "experience": 0.66,
-            "worker": "15015652"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.27,
-            "resilience": 0.57,
-            "medical_condition": True,
-            "experience": 0.74,
-            "worker": "15015653"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.05,
-            "resilience": 0.61,
-            "medical_condition": True,
-            "experience": 0.9,
-            "worker": "15004479"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.29,
-            "resilience": 0.8,
-            "medical_condition": True,
-            "experience": 0.35,
-            "worker": "15016112"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.64,
-            "resilience": 0.62,
-            "medical_condition": True,
-            "experience": 0.72,
-            "worker": "15016591"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.66,
-            "resilience": 0.84,
-            "medical_condition": True,
-            "experience": 0.9,
-            "worker": "15016633"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.65,
-            "resilience": 0.31,
-            "medical_condition": True,
-            "experience": 0.58,
-            "worker": "15017049"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.73,
-            "resilience": 0.09,
-            "medical_condition": True,
-            "experience": 0.75,
-            "worker": "15004696"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.18,
-            "resilience": 0.13,
-            "medical_condition": True,
-            "experience": 0.97,
-            "worker": "15009882"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.53,
-            "resilience": 0.91,
-            "medical_condition": True,
-            "experience": 0.26,
-            "worker": "15009935"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.82,
-            "resilience": 0.48,
-            "medical_condition": True,
-            "experience": 0.75,
-            "worker": "15040627"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.34,
-            "resilience": 0.12,
-            "medical_condition": False,
-            "experience": 0.14,
-            "worker": "15028961"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.97,
-            "resilience": 0.86,
-            "medical_condition": True,
-            "experience": 0.98,
-            "worker": "15028786"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.97,
-            "resilience": 0.8,
-            "medical_condition": True,
-            "experience": 0.79,
-            "worker": "15028790"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.01,
-            "resilience": 0.54,
-            "medical_condition": True,
-            "experience": 0.67,
-            "worker": "15028837"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.67,
-            "resilience": 0.58,
-            "medical_condition": True,
-            "experience": 0.94,
-            "worker": "15028914"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.11,
-            "resilience": 0.23,
-            "medical_condition": True,
-            "experience": 0.88,
-            "worker": "15097932"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.56,
-            "resilience": 0.92,
-            "medical_condition": True,
-            "experience": 0.06,
-            "worker": "15013130"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.82,
-            "resilience": 0.91,
-            "medical_condition": True,
-            "experience": 0.41,
-            "worker": "15013367"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.14,
-            "resilience": 0.95,
-            "medical_condition": True,
-            "experience": 0.49,
-            "worker": "15013533"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.1,
-            "resilience": 0.89,
-            "medical_condition": True,
-            "experience": 0.45,
-            "worker": "15013870"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.67,
-            "resilience": 0.74,
-            "medical_condition": False,
-            "experience": 0.42,
-            "worker": "15015510"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.74,
-            "resilience": 0.15,
-            "medical_condition": True,
-            "experience": 0.1,
-            "worker": "15015554"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.49,
-            "resilience": 0.41,
-            "medical_condition": False,
-            "experience": 0.03,
-            "worker": "15015610"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.37,
-            "resilience": 0.44,
-            "medical_condition": False,
-            "experience": 0.86,
-            "worker": "15017042"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.1,
-            "resilience": 0.69,
-            "medical_condition": True,
-            "experience": 0.98,
-            "worker": "15004666"
-        },
-        {
-            "geometry": "521392800/970",
-            "preference": 0.36,
-            "resilience": 0.4,
-            "medical_condition": True,
-            "experience": 0.12,
-            "worker": "15020309"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.85,
-            "resilience": 0.45,
-            "medical_condition": True,
-            "experience": 0.64,
-            "worker": "15014209"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.6,
-            "resilience": 0.02,
-            "medical_condition": True,
-            "experience": 0.24,
-            "worker": "15014212"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.13,
-            "resilience": 0.56,
-            "medical_condition": True,
-            "experience": 0.77,
-            "worker": "15014727"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.21,
-            "resilience": 0.22,
-            "medical_condition": False,
-            "experience": 0.33,
-            "worker": "15014729"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.15,
-            "resilience": 0.9,
-            "medical_condition": True,
-            "experience": 0.86,
-            "worker": "15014964"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.14,
-            "resilience": 0.13,
-            "medical_condition": True,
-            "experience": 0.17,
-            "worker": "15015125"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.66,
-            "resilience": 0.03,
-            "medical_condition": True,
-            "experience": 0.79,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.24,
-            "resilience": 0.32,
-            "medical_condition": True,
-            "experience": 0.05,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.74,
-            "resilience": 0.53,
-            "medical_condition": True,
-            "experience": 0.48,
-            "worker": "15015264"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.78,
-            "resilience": 0.51,
-            "medical_condition": True,
-            "experience": 0.5,
-            "worker": "15015349"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.95,
-            "resilience": 0.04,
-            "medical_condition": True,
-            "experience": 0.87,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.52,
-            "resilience": 0.46,
-            "medical_condition": False,
-            "experience": 0.06,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.48,
-            "resilience": 0.4,
-            "medical_condition": True,
-            "experience": 0.49,
-            "worker": "15015514"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.91,
-            "resilience": 0.07,
-            "medical_condition": True,
-            "experience": 0.61,
-            "worker": "15015568"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.07,
-            "resilience": 0.28,
-            "medical_condition": True,
-            "experience": 0.55,
-            "worker": "15015650"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.33,
-            "resilience": 0.99,
-            "medical_condition": True,
-            "experience": 0.45,
-            "worker": "15015652"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.61,
-            "resilience": 0.1,
-            "medical_condition": True,
-            "experience": 0.85,
-            "worker": "15015653"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.65,
-            "resilience": 0.77,
-            "medical_condition": True,
-            "experience": 0.22,
-            "worker": "15004479"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.45,
-            "resilience": 0.23,
-            "medical_condition": True,
-            "experience": 0.45,
-            "worker": "15016112"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.42,
-            "resilience": 0.1,
-            "medical_condition": True,
-            "experience": 0.67,
-            "worker": "15016591"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.37,
-            "resilience": 0.15,
-            "medical_condition": False,
-            "experience": 0.07,
-            "worker": "15016633"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.83,
-            "resilience": 0.09,
-            "medical_condition": True,
-            "experience": 0.74,
-            "worker": "15017049"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.81,
-            "resilience": 0.56,
-            "medical_condition": True,
-            "experience": 0.56,
-            "worker": "15004696"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.33,
-            "resilience": 0.12,
-            "medical_condition": True,
-            "experience": 0.67,
-            "worker": "15009882"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.75,
-            "resilience": 0.87,
-            "medical_condition": True,
-            "experience": 0.97,
-            "worker": "15009935"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.6,
-            "resilience": 0.35,
-            "medical_condition": True,
-            "experience": 0.21,
-            "worker": "15040627"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.66,
-            "resilience": 0.22,
-            "medical_condition": True,
-            "experience": 0.85,
-            "worker": "15028961"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.37,
-            "resilience": 0.76,
-            "medical_condition": True,
-            "experience": 0.81,
-            "worker": "15028786"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.85,
-            "resilience": 0.97,
-            "medical_condition": True,
-            "experience": 0.61,
-            "worker": "15028790"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.64,
-            "resilience": 0.03,
-            "medical_condition": False,
-            "experience": 0.83,
-            "worker": "15028837"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.27,
-            "resilience": 0.18,
-            "medical_condition": True,
-            "experience": 0.31,
-            "worker": "15028914"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.34,
-            "resilience": 0.01,
-            "medical_condition": False,
-            "experience": 0.57,
-            "worker": "15097932"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.4,
-            "resilience": 0.14,
-            "medical_condition": True,
-            "experience": 0.03,
-            "worker": "15013130"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.75,
-            "resilience": 0.22,
-            "medical_condition": True,
-            "experience": 0.34,
-            "worker": "15013367"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.37,
-            "resilience": 0.72,
-            "medical_condition": True,
-            "experience": 0.57,
-            "worker": "15013533"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.08,
-            "resilience": 0.05,
-            "medical_condition": True,
-            "experience": 0.62,
-            "worker": "15013870"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.67,
-            "resilience": 0.27,
-            "medical_condition": True,
-            "experience": 0.49,
-            "worker": "15015510"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.44,
-            "resilience": 0.27,
-            "medical_condition": True,
-            "experience": 0.11,
-            "worker": "15015554"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.43,
-            "resilience": 0.28,
-            "medical_condition": True,
-            "experience": 0.49,
-            "worker": "15015610"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.67,
-            "resilience": 0.05,
-            "medical_condition": True,
-            "experience": 0.6,
-            "worker": "15017042"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.01,
-            "resilience": 0.3,
-            "medical_condition": True,
-            "experience": 0.14,
-            "worker": "15004666"
-        },
-        {
-            "geometry": "1340750080",
-            "preference": 0.26,
-            "resilience": 0.33,
-            "medical_condition": True,
-            "experience": 0.75,
-            "worker": "15020309"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.18,
-            "resilience": 0.38,
-            "medical_condition": True,
-            "experience": 0.5,
-            "worker": "15014209"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.83,
-            "resilience": 0.81,
-            "medical_condition": True,
-            "experience": 0.86,
-            "worker": "15014212"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.04,
-            "resilience": 0.02,
-            "medical_condition": False,
-            "experience": 0.86,
-            "worker": "15014727"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.58,
-            "resilience": 0.57,
-            "medical_condition": True,
-            "experience": 0.42,
-            "worker": "15014729"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.12,
-            "resilience": 0.02,
-            "medical_condition": True,
-            "experience": 0.8,
-            "worker": "15014964"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.62,
-            "resilience": 0.83,
-            "medical_condition": False,
-            "experience": 0.09,
-            "worker": "15015125"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.84,
-            "resilience": 0.24,
-            "medical_condition": True,
-            "experience": 0.52,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.4,
-            "resilience": 0.31,
-            "medical_condition": True,
-            "experience": 0.33,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.17,
-            "resilience": 0.51,
-            "medical_condition": True,
-            "experience": 0.51,
-            "worker": "15015264"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.91,
-            "resilience": 0.35,
-            "medical_condition": True,
-            "experience": 0.82,
-            "worker": "15015349"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.82,
-            "resilience": 0.24,
-            "medical_condition": True,
-            "experience": 0.2,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.6,
-            "resilience": 0.76,
-            "medical_condition": True,
-            "experience": 0.18,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.77,
-            "resilience": 0.49,
-            "medical_condition": True,
-            "experience": 0.76,
-            "worker": "15015514"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.45,
-            "resilience": 0.92,
-            "medical_condition": True,
-            "experience": 0.64,
-            "worker": "15015568"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.62,
-            "resilience": 0.86,
-            "medical_condition": True,
-            "experience": 0.15,
-            "worker": "15015650"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.07,
-            "resilience": 0.44,
-            "medical_condition": True,
-            "experience": 0.27,
-            "worker": "15015652"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.06,
-            "resilience": 0.51,
-            "medical_condition": True,
-            "experience": 0.45,
-            "worker": "15015653"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.06,
-            "resilience": 0.83,
-            "medical_condition": True,
-            "experience": 0.86,
-            "worker": "15004479"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.86,
-            "resilience": 0.62,
-            "medical_condition": True,
-            "experience": 0.46,
-            "worker": "15016112"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.55,
-            "resilience": 0.79,
-            "medical_condition": False,
-            "experience": 0.45,
-            "worker": "15016591"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.81,
-            "resilience": 0.65,
-            "medical_condition": True,
-            "experience": 0.48,
-            "worker": "15016633"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.15,
-            "resilience": 0.06,
-            "medical_condition": True,
-            "experience": 0.9,
-            "worker": "15017049"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.34,
-            "resilience": 0.71,
-            "medical_condition": True,
-            "experience": 0.17,
-            "worker": "15004696"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.25,
-            "resilience": 0.44,
-            "medical_condition": True,
-            "experience": 0.52,
-            "worker": "15009882"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.16,
-            "resilience": 0.37,
-            "medical_condition": True,
-            "experience": 0.41,
-            "worker": "15009935"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.34,
-            "resilience": 0.6,
-            "medical_condition": True,
-            "experience": 0.65,
-            "worker": "15040627"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.07,
-            "resilience": 0.09,
-            "medical_condition": True,
-            "experience": 0.28,
-            "worker": "15028961"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.72,
-            "resilience": 0.66,
-            "medical_condition": False,
-            "experience": 0.87,
-            "worker": "15028786"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.33,
-            "resilience": 0.58,
-            "medical_condition": True,
-            "experience": 0.35,
-            "worker": "15028790"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.97,
-            "resilience": 0.7,
-            "medical_condition": True,
-            "experience": 0.6,
-            "worker": "15028837"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.94,
-            "resilience": 0.31,
-            "medical_condition": True,
-            "experience": 0.79,
-            "worker": "15028914"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.81,
-            "resilience": 0.67,
-            "medical_condition": True,
-            "experience": 0.74,
-            "worker": "15097932"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.69,
-            "resilience": 0.53,
-            "medical_condition": True,
-            "experience": 0.42,
-            "worker": "15013130"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.36,
-            "resilience": 0.36,
-            "medical_condition": True,
-            "experience": 0.21,
-            "worker": "15013367"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.95,
-            "resilience": 0.49,
-            "medical_condition": True,
-            "experience": 0.14,
-            "worker": "15013533"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.08,
-            "resilience": 0.84,
-            "medical_condition": True,
-            "experience": 0.77,
-            "worker": "15013870"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.84,
-            "resilience": 0.88,
-            "medical_condition": True,
-            "experience": 0.34,
-            "worker": "15015510"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.77,
-            "resilience": 0.13,
-            "medical_condition": True,
-            "experience": 0.16,
-            "worker": "15015554"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.83,
-            "resilience": 0.77,
-            "medical_condition": True,
-            "experience": 0.17,
-            "worker": "15015610"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.44,
-            "resilience": 0.41,
-            "medical_condition": True,
-            "experience": 0.24,
-            "worker": "15017042"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.44,
-            "resilience": 0.28,
-            "medical_condition": True,
-            "experience": 0.45,
-            "worker": "15004666"
-        },
-        {
-            "geometry": "1342266080",
-            "preference": 0.53,
-            "resilience": 0.31,
-            "medical_condition": True,
-            "experience": 0.47,
-            "worker": "15020309"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.84,
-            "resilience": 0.37,
-            "medical_condition": False,
-            "experience": 0.98,
-            "worker": "15014209"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.46,
-            "resilience": 0.28,
-            "medical_condition": True,
-            "experience": 0.53,
-            "worker": "15014212"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.97,
-            "resilience": 0.82,
-            "medical_condition": True,
-            "experience": 0.14,
-            "worker": "15014727"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.25,
-            "resilience": 0.64,
-            "medical_condition": False,
-            "experience": 0.55,
-            "worker": "15014729"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.1,
-            "resilience": 0.85,
-            "medical_condition": False,
-            "experience": 0.29,
-            "worker": "15014964"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.76,
-            "resilience": 0.27,
-            "medical_condition": False,
-            "experience": 0.15,
-            "worker": "15015125"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.44,
-            "resilience": 0.95,
-            "medical_condition": True,
-            "experience": 0.45,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.35,
-            "resilience": 0.03,
-            "medical_condition": True,
-            "experience": 0.5,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.24,
-            "resilience": 0.99,
-            "medical_condition": True,
-            "experience": 0.03,
-            "worker": "15015264"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.93,
-            "resilience": 0.84,
-            "medical_condition": True,
-            "experience": 0.79,
-            "worker": "15015349"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.14,
-            "resilience": 0.29,
-            "medical_condition": True,
-            "experience": 0.7,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.14,
-            "resilience": 0.71,
-            "medical_condition": True,
-            "experience": 0.01,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.08,
-            "resilience": 0.26,
-            "medical_condition": True,
-            "experience": 0.55,
-            "worker": "15015514"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.73,
-            "resilience": 0.53,
-            "medical_condition": True,
-            "experience": 0.29,
-            "worker": "15015568"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.3,
-            "resilience": 0.05,
-            "medical_condition": True,
-            "experience": 0.79,
-            "worker": "15015650"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.46,
-            "resilience": 0.11,
-            "medical_condition": False,
-            "experience": 0.6,
-            "worker": "15015652"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.02,
-            "resilience": 0.52,
-            "medical_condition": True,
-            "experience": 0.14,
-            "worker": "15015653"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.43,
-            "resilience": 0.61,
-            "medical_condition": True,
-            "experience": 0.42,
-            "worker": "15004479"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.66,
-            "resilience": 0.09,
-            "medical_condition": False,
-            "experience": 0.07,
-            "worker": "15016112"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.53,
-            "resilience": 0.51,
-            "medical_condition": False,
-            "experience": 0.55,
-            "worker": "15016591"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.39,
-            "resilience": 0.47,
-            "medical_condition": True,
-            "experience": 0.98,
-            "worker": "15016633"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.25,
-            "resilience": 0.02,
-            "medical_condition": True,
-            "experience": 0.34,
-            "worker": "15017049"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.73,
-            "resilience": 0.63,
-            "medical_condition": True,
-            "experience": 0.74,
-            "worker": "15004696"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.33,
-            "resilience": 0.04,
-            "medical_condition": True,
-            "experience": 0.81,
-            "worker": "15009882"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.18,
-            "resilience": 0.78,
-            "medical_condition": True,
-            "experience": 0.7,
-            "worker": "15009935"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.63,
-            "resilience": 0.81,
-            "medical_condition": True,
-            "experience": 0.78,
-            "worker": "15040627"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.46,
-            "resilience": 0.29,
-            "medical_condition": True,
-            "experience": 0.2,
-            "worker": "15028961"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.04,
-            "resilience": 0.93,
-            "medical_condition": True,
-            "experience": 0.99,
-            "worker": "15028786"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.54,
-            "resilience": 0.25,
-            "medical_condition": True,
-            "experience": 0.19,
-            "worker": "15028790"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.36,
-            "resilience": 0.78,
-            "medical_condition": False,
-            "experience": 0.33,
-            "worker": "15028837"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.12,
-            "resilience": 0.37,
-            "medical_condition": False,
-            "experience": 0.74,
-            "worker": "15028914"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.89,
-            "resilience": 0.39,
-            "medical_condition": False,
-            "experience": 0.5,
-            "worker": "15097932"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.5,
-            "resilience": 0.92,
-            "medical_condition": True,
-            "experience": 0.8,
-            "worker": "15013130"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.73,
-            "resilience": 0.08,
-            "medical_condition": True,
-            "experience": 0.82,
-            "worker": "15013367"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.55,
-            "resilience": 0.32,
-            "medical_condition": True,
-            "experience": 0.66,
-            "worker": "15013533"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.31,
-            "resilience": 0.6,
-            "medical_condition": True,
-            "experience": 0.69,
-            "worker": "15013870"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.35,
-            "resilience": 0.04,
-            "medical_condition": False,
-            "experience": 0.35,
-            "worker": "15015510"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 1.0,
-            "resilience": 0.27,
-            "medical_condition": False,
-            "experience": 0.95,
-            "worker": "15015554"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.08,
-            "resilience": 0.64,
-            "medical_condition": True,
-            "experience": 0.8,
-            "worker": "15015610"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.68,
-            "resilience": 0.95,
-            "medical_condition": True,
-            "experience": 0.61,
-            "worker": "15017042"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.78,
-            "resilience": 0.03,
-            "medical_condition": True,
-            "experience": 0.78,
-            "worker": "15004666"
-        },
-        {
-            "geometry": "501527470",
-            "preference": 0.37,
-            "resilience": 0.38,
-            "medical_condition": True,
-            "experience": 0.61,
-            "worker": "15020309"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.68,
-            "resilience": 0.95,
-            "medical_condition": True,
-            "experience": 0.76,
-            "worker": "15014209"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.57,
-            "resilience": 0.53,
-            "medical_condition": True,
-            "experience": 0.65,
-            "worker": "15014212"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.25,
-            "resilience": 0.11,
-            "medical_condition": True,
-            "experience": 0.5,
-            "worker": "15014727"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.39,
-            "resilience": 0.56,
-            "medical_condition": True,
-            "experience": 0.26,
-            "worker": "15014729"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.45,
-            "resilience": 1.0,
-            "medical_condition": True,
-            "experience": 0.92,
-            "worker": "15014964"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.49,
-            "resilience": 0.12,
-            "medical_condition": False,
-            "experience": 0.45,
-            "worker": "15015125"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.9,
-            "resilience": 0.45,
-            "medical_condition": True,
-            "experience": 0.68,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.85,
-            "resilience": 0.32,
-            "medical_condition": True,
-            "experience": 0.06,
-            "worker": "15015261"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.54,
-            "resilience": 0.89,
-            "medical_condition": False,
-            "experience": 0.71,
-            "worker": "15015264"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.93,
-            "resilience": 0.64,
-            "medical_condition": True,
-            "experience": 0.51,
-            "worker": "15015349"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.12,
-            "resilience": 0.2,
-            "medical_condition": True,
-            "experience": 0.79,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.03,
-            "resilience": 0.55,
-            "medical_condition": True,
-            "experience": 0.8,
-            "worker": "15015351"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.55,
-            "resilience": 0.61,
-            "medical_condition": True,
-            "experience": 0.31,
-            "worker": "15015514"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 1.0,
-            "resilience": 0.72,
-            "medical_condition": True,
-            "experience": 0.77,
-            "worker": "15015568"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.82,
-            "resilience": 0.07,
-            "medical_condition": False,
-            "experience": 0.64,
-            "worker": "15015650"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.45,
-            "resilience": 0.68,
-            "medical_condition": True,
-            "experience": 0.88,
-            "worker": "15015652"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.78,
-            "resilience": 0.64,
-            "medical_condition": True,
-            "experience": 0.97,
-            "worker": "15015653"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.43,
-            "resilience": 0.91,
-            "medical_condition": True,
-            "experience": 0.12,
-            "worker": "15004479"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.15,
-            "resilience": 0.16,
-            "medical_condition": True,
-            "experience": 0.71,
-            "worker": "15016112"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.35,
-            "resilience": 0.94,
-            "medical_condition": False,
-            "experience": 0.85,
-            "worker": "15016591"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.25,
-            "resilience": 0.64,
-            "medical_condition": True,
-            "experience": 0.13,
-            "worker": "15016633"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.3,
-            "resilience": 0.53,
-            "medical_condition": True,
-            "experience": 0.17,
-            "worker": "15017049"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.94,
-            "resilience": 0.15,
-            "medical_condition": True,
-            "experience": 0.72,
-            "worker": "15004696"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.61,
-            "resilience": 0.84,
-            "medical_condition": True,
-            "experience": 0.83,
-            "worker": "15009882"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.03,
-            "resilience": 0.05,
-            "medical_condition": True,
-            "experience": 0.58,
-            "worker": "15009935"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.65,
-            "resilience": 0.77,
-            "medical_condition": True,
-            "experience": 0.64,
-            "worker": "15040627"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.5,
-            "resilience": 0.63,
-            "medical_condition": True,
-            "experience": 0.96,
-            "worker": "15028961"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.48,
-            "resilience": 0.8,
-            "medical_condition": True,
-            "experience": 0.3,
-            "worker": "15028786"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.07,
-            "resilience": 0.06,
-            "medical_condition": True,
-            "experience": 0.48,
-            "worker": "15028790"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.2,
-            "resilience": 0.61,
-            "medical_condition": True,
-            "experience": 0.72,
-            "worker": "15028837"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.73,
-            "resilience": 0.86,
-            "medical_condition": False,
-            "experience": 0.13,
-            "worker": "15028914"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.37,
-            "resilience": 0.56,
-            "medical_condition": True,
-            "experience": 0.47,
-            "worker": "15097932"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.27,
-            "resilience": 0.25,
-            "medical_condition": True,
-            "experience": 0.29,
-            "worker": "15013130"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.38,
-            "resilience": 0.62,
-            "medical_condition": True,
-            "experience": 0.87,
-            "worker": "15013367"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.16,
-            "resilience": 0.33,
-            "medical_condition": True,
-            "experience": 0.31,
-            "worker": "15013533"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.76,
-            "resilience": 0.5,
-            "medical_condition": True,
-            "experience": 0.5,
-            "worker": "15013870"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.31,
-            "resilience": 0.02,
-            "medical_condition": False,
-            "experience": 0.51,
-            "worker": "15015510"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.97,
-            "resilience": 0.22,
-            "medical_condition": True,
-            "experience": 0.05,
-            "worker": "15015554"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.49,
-            "resilience": 0.88,
-            "medical_condition": True,
-            "experience": 0.47,
-            "worker": "15015610"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.54,
-            "resilience": 0.85,
-            "medical_condition": True,
-            "experience": 0.88,
-            "worker": "15017042"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.73,
-            "resilience": 0.76,
-            "medical_condition": True,
-            "experience": 0.4,
-            "worker": "15004666"
-        },
-        {
-            "geometry": "1343314080",
-            "preference": 0.57,
-            "resilience": 0.19,
-            "medical_condition": True,
-            "experience": 0.07,
-            "worker": "15020309"
-        }
-    ]),
-    'availabilities': fields.List(fields.Nested(availabilities_model), required=True,
-                                  description="Availability details for workers.",
-                                  example=[
-        {
-            "date": "2024-09-04",
-            "worker": "15014209",
-            "from_timestamp": 1693800000.0,
-            "end_timestamp": 1693828800.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15014212",
-            "from_timestamp": 1693800000.0,
-            "end_timestamp": 1693828800.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15015652",
-            "from_timestamp": 1693800000.0,
-            "end_timestamp": 1693828800.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15015653",
-            "from_timestamp": 1693800000.0,
-            "end_timestamp": 1693828800.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15004479",
-            "from_timestamp": 1693800000.0,
-            "end_timestamp": 1693828800.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15016112",
-            "from_timestamp": 1693800000.0,
-            "end_timestamp": 1693828800.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15016633",
-            "from_timestamp": 1693800000.0,
-            "end_timestamp": 1693828800.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15009935",
-            "from_timestamp": 1693800000.0,
-            "end_timestamp": 1693828800.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15028786",
-            "from_timestamp": 1693800000.0,
-            "end_timestamp": 1693828800.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15028837",
-            "from_timestamp": 1693800000.0,
-            "end_timestamp": 1693828800.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15097932",
-            "from_timestamp": 1693800000.0,
-            "end_timestamp": 1693828800.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15013130",
-            "from_timestamp": 1693800000.0,
-            "end_timestamp": 1693828800.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15013533",
-            "from_timestamp": 1693800000.0,
-            "end_timestamp": 1693828800.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15013870",
-            "from_timestamp": 1693800000.0,
-            "end_timestamp": 1693828800.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15015610",
-            "from_timestamp": 1693800000.0,
-            "end_timestamp": 1693828800.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15017042",
-            "from_timestamp": 1693800000.0,
-            "end_timestamp": 1693828800.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15020309",
-            "from_timestamp": 1693800000.0,
-            "end_timestamp": 1693828800.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15014209",
-            "from_timestamp": 1693886400.0,
-            "end_timestamp": 1693915200.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15014212",
-            "from_timestamp": 1693886400.0,
-            "end_timestamp": 1693915200.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15015652",
-            "from_timestamp": 1693886400.0,
-            "end_timestamp": 1693915200.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15015653",
-            "from_timestamp": 1693886400.0,
-            "end_timestamp": 1693915200.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15004479",
-            "from_timestamp": 1693886400.0,
-            "end_timestamp": 1693915200.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15016112",
-            "from_timestamp": 1693886400.0,
-            "end_timestamp": 1693915200.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15016633",
-            "from_timestamp": 1693886400.0,
-            "end_timestamp": 1693915200.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15009935",
-            "from_timestamp": 1693886400.0,
-            "end_timestamp": 1693915200.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15028786",
-            "from_timestamp": 1693886400.0,
-            "end_timestamp": 1693915200.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15028837",
-            "from_timestamp": 1693886400.0,
-            "end_timestamp": 1693915200.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15097932",
-            "from_timestamp": 1693886400.0,
-            "end_timestamp": 1693915200.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15013130",
-            "from_timestamp": 1693886400.0,
-            "end_timestamp": 1693915200.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15013533",
-            "from_timestamp": 1693886400.0,
-            "end_timestamp": 1693915200.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15013870",
-            "from_timestamp": 1693886400.0,
-            "end_timestamp": 1693915200.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15015610",
-            "from_timestamp": 1693886400.0,
-            "end_timestamp": 1693915200.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15017042",
-            "from_timestamp": 1693886400.0,
-            "end_timestamp": 1693915200.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15020309",
-            "from_timestamp": 1693886400.0,
-            "end_timestamp": 1693915200.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15014209",
-            "from_timestamp": 1693972800.0,
-            "end_timestamp": 1694001600.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15014212",
-            "from_timestamp": 1693972800.0,
-            "end_timestamp": 1694001600.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15015652",
-            "from_timestamp": 1693972800.0,
-            "end_timestamp": 1694001600.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15015653",
-            "from_timestamp": 1693972800.0,
-            "end_timestamp": 1694001600.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15004479",
-            "from_timestamp": 1693972800.0,
-            "end_timestamp": 1694001600.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15016112",
-            "from_timestamp": 1693972800.0,
-            "end_timestamp": 1694001600.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15016633",
-            "from_timestamp": 1693972800.0,
-            "end_timestamp": 1694001600.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15009935",
-            "from_timestamp": 1693972800.0,
-            "end_timestamp": 1694001600.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15028786",
-            "from_timestamp": 1693972800.0,
-            "end_timestamp": 1694001600.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15028837",
-            "from_timestamp": 1693972800.0,
-            "end_timestamp": 1694001600.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15097932",
-            "from_timestamp": 1693972800.0,
-            "end_timestamp": 1694001600.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15013130",
-            "from_timestamp": 1693972800.0,
-            "end_timestamp": 1694001600.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15013533",
-            "from_timestamp": 1693972800.0,
-            "end_timestamp": 1694001600.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15013870",
-            "from_timestamp": 1693972800.0,
-            "end_timestamp": 1694001600.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15015610",
-            "from_timestamp": 1693972800.0,
-            "end_timestamp": 1694001600.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15017042",
-            "from_timestamp": 1693972800.0,
-            "end_timestamp": 1694001600.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15020309",
-            "from_timestamp": 1693972800.0,
-            "end_timestamp": 1694001600.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15014209",
-            "from_timestamp": 1694059200.0,
-            "end_timestamp": 1694088000.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15014212",
-            "from_timestamp": 1694059200.0,
-            "end_timestamp": 1694088000.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15015652",
-            "from_timestamp": 1694059200.0,
-            "end_timestamp": 1694088000.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15015653",
-            "from_timestamp": 1694059200.0,
-            "end_timestamp": 1694088000.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15004479",
-            "from_timestamp": 1694059200.0,
-            "end_timestamp": 1694088000.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15016112",
-            "from_timestamp": 1694059200.0,
-            "end_timestamp": 1694088000.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15016633",
-            "from_timestamp": 1694059200.0,
-            "end_timestamp": 1694088000.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15009935",
-            "from_timestamp": 1694059200.0,
-            "end_timestamp": 1694088000.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15028786",
-            "from_timestamp": 1694059200.0,
-            "end_timestamp": 1694088000.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15028837",
-            "from_timestamp": 1694059200.0,
-            "end_timestamp": 1694088000.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15097932",
-            "from_timestamp": 1694059200.0,
-            "end_timestamp": 1694088000.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15013130",
-            "from_timestamp": 1694059200.0,
-            "end_timestamp": 1694088000.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15013533",
-            "from_timestamp": 1694059200.0,
-            "end_timestamp": 1694088000.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15013870",
-            "from_timestamp": 1694059200.0,
-            "end_timestamp": 1694088000.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15015610",
-            "from_timestamp": 1694059200.0,
-            "end_timestamp": 1694088000.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15017042",
-            "from_timestamp": 1694059200.0,
-            "end_timestamp": 1694088000.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15020309",
-            "from_timestamp": 1694059200.0,
-            "end_timestamp": 1694088000.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15014209",
-            "from_timestamp": 1694145600.0,
-            "end_timestamp": 1694174400.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15014212",
-            "from_timestamp": 1694145600.0,
-            "end_timestamp": 1694174400.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15015652",
-            "from_timestamp": 1694145600.0,
-            "end_timestamp": 1694174400.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15015653",
-            "from_timestamp": 1694145600.0,
-            "end_timestamp": 1694174400.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15004479",
-            "from_timestamp": 1694145600.0,
-            "end_timestamp": 1694174400.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15016112",
-            "from_timestamp": 1694145600.0,
-            "end_timestamp": 1694174400.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15016633",
-            "from_timestamp": 1694145600.0,
-            "end_timestamp": 1694174400.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15009935",
-            "from_timestamp": 1694145600.0,
-            "end_timestamp": 1694174400.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15028786",
-            "from_timestamp": 1694145600.0,
-            "end_timestamp": 1694174400.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15028837",
-            "from_timestamp": 1694145600.0,
-            "end_timestamp": 1694174400.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15097932",
-            "from_timestamp": 1694145600.0,
-            "end_timestamp": 1694174400.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15013130",
-            "from_timestamp": 1694145600.0,
-            "end_timestamp": 1694174400.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15013533",
-            "from_timestamp": 1694145600.0,
-            "end_timestamp": 1694174400.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15013870",
-            "from_timestamp": 1694145600.0,
-            "end_timestamp": 1694174400.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15015610",
-            "from_timestamp": 1694145600.0,
-            "end_timestamp": 1694174400.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15017042",
-            "from_timestamp": 1694145600.0,
-            "end_timestamp": 1694174400.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15020309",
-            "from_timestamp": 1694145600.0,
-            "end_timestamp": 1694174400.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15014209",
-            "from_timestamp": 1695009600.0,
-            "end_timestamp": 1695038400.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15014212",
-            "from_timestamp": 1695009600.0,
-            "end_timestamp": 1695038400.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15015652",
-            "from_timestamp": 1695009600.0,
-            "end_timestamp": 1695038400.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15015653",
-            "from_timestamp": 1695009600.0,
-            "end_timestamp": 1695038400.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15004479",
-            "from_timestamp": 1695009600.0,
-            "end_timestamp": 1695038400.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15016112",
-            "from_timestamp": 1695009600.0,
-            "end_timestamp": 1695038400.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15016633",
-            "from_timestamp": 1695009600.0,
-            "end_timestamp": 1695038400.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15009935",
-            "from_timestamp": 1695009600.0,
-            "end_timestamp": 1695038400.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15028786",
-            "from_timestamp": 1695009600.0,
-            "end_timestamp": 1695038400.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15028837",
-            "from_timestamp": 1695009600.0,
-            "end_timestamp": 1695038400.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15097932",
-            "from_timestamp": 1695009600.0,
-            "end_timestamp": 1695038400.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15013130",
-            "from_timestamp": 1695009600.0,
-            "end_timestamp": 1695038400.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15013533",
-            "from_timestamp": 1695009600.0,
-            "end_timestamp": 1695038400.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15013870",
-            "from_timestamp": 1695009600.0,
-            "end_timestamp": 1695038400.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15015610",
-            "from_timestamp": 1695009600.0,
-            "end_timestamp": 1695038400.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15017042",
-            "from_timestamp": 1695009600.0,
-            "end_timestamp": 1695038400.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15020309",
-            "from_timestamp": 1695009600.0,
-            "end_timestamp": 1695038400.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15014209",
-            "from_timestamp": 1695096000.0,
-            "end_timestamp": 1695124800.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15014212",
-            "from_timestamp": 1695096000.0,
-            "end_timestamp": 1695124800.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15015652",
-            "from_timestamp": 1695096000.0,
-            "end_timestamp": 1695124800.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15015653",
-            "from_timestamp": 1695096000.0,
-            "end_timestamp": 1695124800.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15004479",
-            "from_timestamp": 1695096000.0,
-            "end_timestamp": 1695124800.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15016112",
-            "from_timestamp": 1695096000.0,
-            "end_timestamp": 1695124800.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15016633",
-            "from_timestamp": 1695096000.0,
-            "end_timestamp": 1695124800.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15009935",
-            "from_timestamp": 1695096000.0,
-            "end_timestamp": 1695124800.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15028786",
-            "from_timestamp": 1695096000.0,
-            "end_timestamp": 1695124800.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15028837",
-            "from_timestamp": 1695096000.0,
-            "end_timestamp": 1695124800.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15097932",
-            "from_timestamp": 1695096000.0,
-            "end_timestamp": 1695124800.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15013130",
-            "from_timestamp": 1695096000.0,
-            "end_timestamp": 1695124800.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15013533",
-            "from_timestamp": 1695096000.0,
-            "end_timestamp": 1695124800.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15013870",
-            "from_timestamp": 1695096000.0,
-            "end_timestamp": 1695124800.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15015610",
-            "from_timestamp": 1695096000.0,
-            "end_timestamp": 1695124800.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15017042",
-            "from_timestamp": 1695096000.0,
-            "end_timestamp": 1695124800.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15020309",
-            "from_timestamp": 1695096000.0,
-            "end_timestamp": 1695124800.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15014209",
-            "from_timestamp": 1695182400.0,
-            "end_timestamp": 1695211200.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15014212",
-            "from_timestamp": 1695182400.0,
-            "end_timestamp": 1695211200.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15015652",
-            "from_timestamp": 1695182400.0,
-            "end_timestamp": 1695211200.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15015653",
-            "from_timestamp": 1695182400.0,
-            "end_timestamp": 1695211200.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15004479",
-            "from_timestamp": 1695182400.0,
-            "end_timestamp": 1695211200.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15016112",
-            "from_timestamp": 1695182400.0,
-            "end_timestamp": 1695211200.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15016633",
-            "from_timestamp": 1695182400.0,
-            "end_timestamp": 1695211200.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15009935",
-            "from_timestamp": 1695182400.0,
-            "end_timestamp": 1695211200.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15028786",
-            "from_timestamp": 1695182400.0,
-            "end_timestamp": 1695211200.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15028837",
-            "from_timestamp": 1695182400.0,
-            "end_timestamp": 1695211200.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15097932",
-            "from_timestamp": 1695182400.0,
-            "end_timestamp": 1695211200.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15013130",
-            "from_timestamp": 1695182400.0,
-            "end_timestamp": 1695211200.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15013533",
-            "from_timestamp": 1695182400.0,
-            "end_timestamp": 1695211200.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15013870",
-            "from_timestamp": 1695182400.0,
-            "end_timestamp": 1695211200.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15015610",
-            "from_timestamp": 1695182400.0,
-            "end_timestamp": 1695211200.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15017042",
-            "from_timestamp": 1695182400.0,
-            "end_timestamp": 1695211200.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15020309",
-            "from_timestamp": 1695182400.0,
-            "end_timestamp": 1695211200.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15014209",
-            "from_timestamp": 1695268800.0,
-            "end_timestamp": 1695297600.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15014212",
-            "from_timestamp": 1695268800.0,
-            "end_timestamp": 1695297600.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15015652",
-            "from_timestamp": 1695268800.0,
-            "end_timestamp": 1695297600.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15015653",
-            "from_timestamp": 1695268800.0,
-            "end_timestamp": 1695297600.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15004479",
-            "from_timestamp": 1695268800.0,
-            "end_timestamp": 1695297600.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15016112",
-            "from_timestamp": 1695268800.0,
-            "end_timestamp": 1695297600.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15016633",
-            "from_timestamp": 1695268800.0,
-            "end_timestamp": 1695297600.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15009935",
-            "from_timestamp": 1695268800.0,
-            "end_timestamp": 1695297600.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15028786",
-            "from_timestamp": 1695268800.0,
-            "end_timestamp": 1695297600.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15028837",
-            "from_timestamp": 1695268800.0,
-            "end_timestamp": 1695297600.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15097932",
-            "from_timestamp": 1695268800.0,
-            "end_timestamp": 1695297600.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15013130",
-            "from_timestamp": 1695268800.0,
-            "end_timestamp": 1695297600.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15013533",
-            "from_timestamp": 1695268800.0,
-            "end_timestamp": 1695297600.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15013870",
-            "from_timestamp": 1695268800.0,
-            "end_timestamp": 1695297600.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15015610",
-            "from_timestamp": 1695268800.0,
-            "end_timestamp": 1695297600.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15017042",
-            "from_timestamp": 1695268800.0,
-            "end_timestamp": 1695297600.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15020309",
-            "from_timestamp": 1695268800.0,
-            "end_timestamp": 1695297600.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15014209",
-            "from_timestamp": 1695355200.0,
-            "end_timestamp": 1695384000.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15014212",
-            "from_timestamp": 1695355200.0,
-            "end_timestamp": 1695384000.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15015652",
-            "from_timestamp": 1695355200.0,
-            "end_timestamp": 1695384000.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15015653",
-            "from_timestamp": 1695355200.0,
-            "end_timestamp": 1695384000.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15004479",
-            "from_timestamp": 1695355200.0,
-            "end_timestamp": 1695384000.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15016112",
-            "from_timestamp": 1695355200.0,
-            "end_timestamp": 1695384000.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15016633",
-            "from_timestamp": 1695355200.0,
-            "end_timestamp": 1695384000.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15009935",
-            "from_timestamp": 1695355200.0,
-            "end_timestamp": 1695384000.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15028786",
-            "from_timestamp": 1695355200.0,
-            "end_timestamp": 1695384000.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15028837",
-            "from_timestamp": 1695355200.0,
-            "end_timestamp": 1695384000.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15097932",
-            "from_timestamp": 1695355200.0,
-            "end_timestamp": 1695384000.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15013130",
-            "from_timestamp": 1695355200.0,
-            "end_timestamp": 1695384000.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15013533",
-            "from_timestamp": 1695355200.0,
-            "end_timestamp": 1695384000.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15013870",
-            "from_timestamp": 1695355200.0,
-            "end_timestamp": 1695384000.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15015610",
-            "from_timestamp": 1695355200.0,
-            "end_timestamp": 1695384000.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15017042",
-            "from_timestamp": 1695355200.0,
-            "end_timestamp": 1695384000.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15020309",
-            "from_timestamp": 1695355200.0,
-            "end_timestamp": 1695384000.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15014727",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15014729",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15014964",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15015125",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15015261",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15015264",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15015351",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15015514",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15015568",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15016591",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15017049",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15004696",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15009882",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15040627",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15028961",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15028790",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15028914",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15013367",
-            "from_timestamp": 1693828800.0,
-            "end_timestamp": 1693857600.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15014727",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15014729",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15014964",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15015125",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15015261",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15015264",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15015351",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15015514",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15015568",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15016591",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15017049",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15004696",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15009882",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15040627",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15028961",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15028790",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15028914",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15013367",
-            "from_timestamp": 1693915200.0,
-            "end_timestamp": 1693944000.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15014727",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15014729",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15014964",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15015125",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15015261",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15015264",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15015351",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15015514",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15015568",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15016591",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15017049",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15004696",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15009882",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15040627",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15028961",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15028790",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15028914",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15013367",
-            "from_timestamp": 1694001600.0,
-            "end_timestamp": 1694030400.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15014727",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15014729",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15014964",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15015125",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15015261",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15015264",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15015351",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15015514",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15015568",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15016591",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15017049",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15004696",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15009882",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15040627",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15028961",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15028790",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15028914",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15013367",
-            "from_timestamp": 1694088000.0,
-            "end_timestamp": 1694116800.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15014727",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15014729",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15014964",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15015125",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15015261",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15015264",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15015351",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15015514",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15015568",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15016591",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15017049",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15004696",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15009882",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15040627",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15028961",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15028790",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15028914",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15013367",
-            "from_timestamp": 1694174400.0,
-            "end_timestamp": 1694203200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15014727",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15014729",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15014964",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15015125",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15015261",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15015264",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15015351",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15015514",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15015568",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15016591",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15017049",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15004696",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15009882",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15040627",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15028961",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15028790",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15028914",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15013367",
-            "from_timestamp": 1695038400.0,
-            "end_timestamp": 1695067200.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15014727",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15014729",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15014964",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15015125",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15015261",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15015264",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15015351",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15015514",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15015568",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15016591",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15017049",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15004696",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15009882",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15040627",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15028961",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15028790",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15028914",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15013367",
-            "from_timestamp": 1695124800.0,
-            "end_timestamp": 1695153600.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15014727",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15014729",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15014964",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15015125",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15015261",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15015264",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15015351",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15015514",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15015568",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15016591",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15017049",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15004696",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15009882",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15040627",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15028961",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15028790",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15028914",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15013367",
-            "from_timestamp": 1695211200.0,
-            "end_timestamp": 1695240000.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15014727",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15014729",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15014964",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15015125",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15015261",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15015264",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15015351",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15015514",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15015568",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15016591",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15017049",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15004696",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15009882",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15040627",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15028961",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15028790",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15028914",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15013367",
-            "from_timestamp": 1695297600.0,
-            "end_timestamp": 1695326400.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15014727",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15014729",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15014964",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15015125",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15015261",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15015264",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15015351",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15015514",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15015568",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15016591",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15017049",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15004696",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15009882",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15040627",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15028961",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15028790",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15028914",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15013367",
-            "from_timestamp": 1695384000.0,
-            "end_timestamp": 1695412800.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15015264",
-            "from_timestamp": 1693857600.0,
-            "end_timestamp": 1693886400.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15015650",
-            "from_timestamp": 1693857600.0,
-            "end_timestamp": 1693886400.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15015510",
-            "from_timestamp": 1693857600.0,
-            "end_timestamp": 1693886400.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15015554",
-            "from_timestamp": 1693857600.0,
-            "end_timestamp": 1693886400.0
-        },
-        {
-            "date": "2024-09-04",
-            "worker": "15004666",
-            "from_timestamp": 1693857600.0,
-            "end_timestamp": 1693886400.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15015264",
-            "from_timestamp": 1693944000.0,
-            "end_timestamp": 1693972800.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15015650",
-            "from_timestamp": 1693944000.0,
-            "end_timestamp": 1693972800.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15015510",
-            "from_timestamp": 1693944000.0,
-            "end_timestamp": 1693972800.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15015554",
-            "from_timestamp": 1693944000.0,
-            "end_timestamp": 1693972800.0
-        },
-        {
-            "date": "2024-09-05",
-            "worker": "15004666",
-            "from_timestamp": 1693944000.0,
-            "end_timestamp": 1693972800.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15015264",
-            "from_timestamp": 1694030400.0,
-            "end_timestamp": 1694059200.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15015650",
-            "from_timestamp": 1694030400.0,
-            "end_timestamp": 1694059200.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15015510",
-            "from_timestamp": 1694030400.0,
-            "end_timestamp": 1694059200.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15015554",
-            "from_timestamp": 1694030400.0,
-            "end_timestamp": 1694059200.0
-        },
-        {
-            "date": "2024-09-06",
-            "worker": "15004666",
-            "from_timestamp": 1694030400.0,
-            "end_timestamp": 1694059200.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15015264",
-            "from_timestamp": 1694116800.0,
-            "end_timestamp": 1694145600.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15015650",
-            "from_timestamp": 1694116800.0,
-            "end_timestamp": 1694145600.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15015510",
-            "from_timestamp": 1694116800.0,
-            "end_timestamp": 1694145600.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15015554",
-            "from_timestamp": 1694116800.0,
-            "end_timestamp": 1694145600.0
-        },
-        {
-            "date": "2024-09-07",
-            "worker": "15004666",
-            "from_timestamp": 1694116800.0,
-            "end_timestamp": 1694145600.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15015264",
-            "from_timestamp": 1694203200.0,
-            "end_timestamp": 1694232000.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15015650",
-            "from_timestamp": 1694203200.0,
-            "end_timestamp": 1694232000.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15015510",
-            "from_timestamp": 1694203200.0,
-            "end_timestamp": 1694232000.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15015554",
-            "from_timestamp": 1694203200.0,
-            "end_timestamp": 1694232000.0
-        },
-        {
-            "date": "2024-09-08",
-            "worker": "15004666",
-            "from_timestamp": 1694203200.0,
-            "end_timestamp": 1694232000.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15015264",
-            "from_timestamp": 1694462400.0,
-            "end_timestamp": 1694491200.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15015650",
-            "from_timestamp": 1694462400.0,
-            "end_timestamp": 1694491200.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15015510",
-            "from_timestamp": 1694462400.0,
-            "end_timestamp": 1694491200.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15015554",
-            "from_timestamp": 1694462400.0,
-            "end_timestamp": 1694491200.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15004666",
-            "from_timestamp": 1694462400.0,
-            "end_timestamp": 1694491200.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15015264",
-            "from_timestamp": 1694548800.0,
-            "end_timestamp": 1694577600.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15015650",
-            "from_timestamp": 1694548800.0,
-            "end_timestamp": 1694577600.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15015510",
-            "from_timestamp": 1694548800.0,
-            "end_timestamp": 1694577600.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15015554",
-            "from_timestamp": 1694548800.0,
-            "end_timestamp": 1694577600.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15004666",
-            "from_timestamp": 1694548800.0,
-            "end_timestamp": 1694577600.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15015264",
-            "from_timestamp": 1694635200.0,
-            "end_timestamp": 1694664000.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15015650",
-            "from_timestamp": 1694635200.0,
-            "end_timestamp": 1694664000.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15015510",
-            "from_timestamp": 1694635200.0,
-            "end_timestamp": 1694664000.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15015554",
-            "from_timestamp": 1694635200.0,
-            "end_timestamp": 1694664000.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15004666",
-            "from_timestamp": 1694635200.0,
-            "end_timestamp": 1694664000.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15015264",
-            "from_timestamp": 1694721600.0,
-            "end_timestamp": 1694750400.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15015650",
-            "from_timestamp": 1694721600.0,
-            "end_timestamp": 1694750400.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15015510",
-            "from_timestamp": 1694721600.0,
-            "end_timestamp": 1694750400.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15015554",
-            "from_timestamp": 1694721600.0,
-            "end_timestamp": 1694750400.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15004666",
-            "from_timestamp": 1694721600.0,
-            "end_timestamp": 1694750400.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15015264",
-            "from_timestamp": 1694808000.0,
-            "end_timestamp": 1694836800.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15015650",
-            "from_timestamp": 1694808000.0,
-            "end_timestamp": 1694836800.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15015510",
-            "from_timestamp": 1694808000.0,
-            "end_timestamp": 1694836800.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15015554",
-            "from_timestamp": 1694808000.0,
-            "end_timestamp": 1694836800.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15004666",
-            "from_timestamp": 1694808000.0,
-            "end_timestamp": 1694836800.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15015264",
-            "from_timestamp": 1695067200.0,
-            "end_timestamp": 1695096000.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15015650",
-            "from_timestamp": 1695067200.0,
-            "end_timestamp": 1695096000.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15015510",
-            "from_timestamp": 1695067200.0,
-            "end_timestamp": 1695096000.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15015554",
-            "from_timestamp": 1695067200.0,
-            "end_timestamp": 1695096000.0
-        },
-        {
-            "date": "2024-09-18",
-            "worker": "15004666",
-            "from_timestamp": 1695067200.0,
-            "end_timestamp": 1695096000.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15015264",
-            "from_timestamp": 1695153600.0,
-            "end_timestamp": 1695182400.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15015650",
-            "from_timestamp": 1695153600.0,
-            "end_timestamp": 1695182400.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15015510",
-            "from_timestamp": 1695153600.0,
-            "end_timestamp": 1695182400.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15015554",
-            "from_timestamp": 1695153600.0,
-            "end_timestamp": 1695182400.0
-        },
-        {
-            "date": "2024-09-19",
-            "worker": "15004666",
-            "from_timestamp": 1695153600.0,
-            "end_timestamp": 1695182400.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15015264",
-            "from_timestamp": 1695240000.0,
-            "end_timestamp": 1695268800.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15015650",
-            "from_timestamp": 1695240000.0,
-            "end_timestamp": 1695268800.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15015510",
-            "from_timestamp": 1695240000.0,
-            "end_timestamp": 1695268800.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15015554",
-            "from_timestamp": 1695240000.0,
-            "end_timestamp": 1695268800.0
-        },
-        {
-            "date": "2024-09-20",
-            "worker": "15004666",
-            "from_timestamp": 1695240000.0,
-            "end_timestamp": 1695268800.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15015264",
-            "from_timestamp": 1695326400.0,
-            "end_timestamp": 1695355200.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15015650",
-            "from_timestamp": 1695326400.0,
-            "end_timestamp": 1695355200.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15015510",
-            "from_timestamp": 1695326400.0,
-            "end_timestamp": 1695355200.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15015554",
-            "from_timestamp": 1695326400.0,
-            "end_timestamp": 1695355200.0
-        },
-        {
-            "date": "2024-09-21",
-            "worker": "15004666",
-            "from_timestamp": 1695326400.0,
-            "end_timestamp": 1695355200.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15015264",
-            "from_timestamp": 1695412800.0,
-            "end_timestamp": 1695441600.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15015650",
-            "from_timestamp": 1695412800.0,
-            "end_timestamp": 1695441600.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15015510",
-            "from_timestamp": 1695412800.0,
-            "end_timestamp": 1695441600.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15015554",
-            "from_timestamp": 1695412800.0,
-            "end_timestamp": 1695441600.0
-        },
-        {
-            "date": "2024-09-22",
-            "worker": "15004666",
-            "from_timestamp": 1695412800.0,
-            "end_timestamp": 1695441600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15014727",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15014729",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15014964",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15015125",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15015261",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15015264",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15015351",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15015514",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15015568",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15016591",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15017049",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15004696",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15009882",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15040627",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15028961",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15028790",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15028914",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15013367",
-            "from_timestamp": 1694404800.0,
-            "end_timestamp": 1694433600.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15014727",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15014729",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15014964",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15015125",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15015261",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15015264",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15015351",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15015514",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15015568",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15016591",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15017049",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15004696",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15009882",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15040627",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15028961",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15028790",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15028914",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15013367",
-            "from_timestamp": 1694491200.0,
-            "end_timestamp": 1694520000.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15014727",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15014729",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15014964",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15015125",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15015261",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15015264",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15015351",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15015514",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15015568",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15016591",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15017049",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15004696",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15009882",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15040627",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15028961",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15028790",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15028914",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15013367",
-            "from_timestamp": 1694577600.0,
-            "end_timestamp": 1694606400.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15014727",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15014729",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15014964",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15015125",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15015261",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15015264",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15015351",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15015514",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15015568",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15016591",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15017049",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15004696",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15009882",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15040627",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15028961",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15028790",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15028914",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15013367",
-            "from_timestamp": 1694664000.0,
-            "end_timestamp": 1694692800.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15014727",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15014729",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15014964",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15015125",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15015261",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15015264",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15015351",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15015514",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15015568",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15016591",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15017049",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15004696",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15009882",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15040627",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15028961",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15028790",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15028914",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15013367",
-            "from_timestamp": 1694750400.0,
-            "end_timestamp": 1694779200.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15014209",
-            "from_timestamp": 1694433600.0,
-            "end_timestamp": 1694462400.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15014212",
-            "from_timestamp": 1694433600.0,
-            "end_timestamp": 1694462400.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15015652",
-            "from_timestamp": 1694433600.0,
-            "end_timestamp": 1694462400.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15015653",
-            "from_timestamp": 1694433600.0,
-            "end_timestamp": 1694462400.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15004479",
-            "from_timestamp": 1694433600.0,
-            "end_timestamp": 1694462400.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15016112",
-            "from_timestamp": 1694433600.0,
-            "end_timestamp": 1694462400.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15016633",
-            "from_timestamp": 1694433600.0,
-            "end_timestamp": 1694462400.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15009935",
-            "from_timestamp": 1694433600.0,
-            "end_timestamp": 1694462400.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15028786",
-            "from_timestamp": 1694433600.0,
-            "end_timestamp": 1694462400.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15028837",
-            "from_timestamp": 1694433600.0,
-            "end_timestamp": 1694462400.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15097932",
-            "from_timestamp": 1694433600.0,
-            "end_timestamp": 1694462400.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15013130",
-            "from_timestamp": 1694433600.0,
-            "end_timestamp": 1694462400.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15013533",
-            "from_timestamp": 1694433600.0,
-            "end_timestamp": 1694462400.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15013870",
-            "from_timestamp": 1694433600.0,
-            "end_timestamp": 1694462400.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15015610",
-            "from_timestamp": 1694433600.0,
-            "end_timestamp": 1694462400.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15017042",
-            "from_timestamp": 1694433600.0,
-            "end_timestamp": 1694462400.0
-        },
-        {
-            "date": "2024-09-11",
-            "worker": "15020309",
-            "from_timestamp": 1694433600.0,
-            "end_timestamp": 1694462400.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15014209",
-            "from_timestamp": 1694520000.0,
-            "end_timestamp": 1694548800.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15014212",
-            "from_timestamp": 1694520000.0,
-            "end_timestamp": 1694548800.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15015652",
-            "from_timestamp": 1694520000.0,
-            "end_timestamp": 1694548800.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15015653",
-            "from_timestamp": 1694520000.0,
-            "end_timestamp": 1694548800.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15004479",
-            "from_timestamp": 1694520000.0,
-            "end_timestamp": 1694548800.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15016112",
-            "from_timestamp": 1694520000.0,
-            "end_timestamp": 1694548800.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15016633",
-            "from_timestamp": 1694520000.0,
-            "end_timestamp": 1694548800.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15009935",
-            "from_timestamp": 1694520000.0,
-            "end_timestamp": 1694548800.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15028786",
-            "from_timestamp": 1694520000.0,
-            "end_timestamp": 1694548800.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15028837",
-            "from_timestamp": 1694520000.0,
-            "end_timestamp": 1694548800.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15097932",
-            "from_timestamp": 1694520000.0,
-            "end_timestamp": 1694548800.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15013130",
-            "from_timestamp": 1694520000.0,
-            "end_timestamp": 1694548800.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15013533",
-            "from_timestamp": 1694520000.0,
-            "end_timestamp": 1694548800.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15013870",
-            "from_timestamp": 1694520000.0,
-            "end_timestamp": 1694548800.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15015610",
-            "from_timestamp": 1694520000.0,
-            "end_timestamp": 1694548800.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15017042",
-            "from_timestamp": 1694520000.0,
-            "end_timestamp": 1694548800.0
-        },
-        {
-            "date": "2024-09-12",
-            "worker": "15020309",
-            "from_timestamp": 1694520000.0,
-            "end_timestamp": 1694548800.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15014209",
-            "from_timestamp": 1694606400.0,
-            "end_timestamp": 1694635200.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15014212",
-            "from_timestamp": 1694606400.0,
-            "end_timestamp": 1694635200.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15015652",
-            "from_timestamp": 1694606400.0,
-            "end_timestamp": 1694635200.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15015653",
-            "from_timestamp": 1694606400.0,
-            "end_timestamp": 1694635200.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15004479",
-            "from_timestamp": 1694606400.0,
-            "end_timestamp": 1694635200.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15016112",
-            "from_timestamp": 1694606400.0,
-            "end_timestamp": 1694635200.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15016633",
-            "from_timestamp": 1694606400.0,
-            "end_timestamp": 1694635200.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15009935",
-            "from_timestamp": 1694606400.0,
-            "end_timestamp": 1694635200.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15028786",
-            "from_timestamp": 1694606400.0,
-            "end_timestamp": 1694635200.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15028837",
-            "from_timestamp": 1694606400.0,
-            "end_timestamp": 1694635200.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15097932",
-            "from_timestamp": 1694606400.0,
-            "end_timestamp": 1694635200.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15013130",
-            "from_timestamp": 1694606400.0,
-            "end_timestamp": 1694635200.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15013533",
-            "from_timestamp": 1694606400.0,
-            "end_timestamp": 1694635200.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15013870",
-            "from_timestamp": 1694606400.0,
-            "end_timestamp": 1694635200.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15015610",
-            "from_timestamp": 1694606400.0,
-            "end_timestamp": 1694635200.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15017042",
-            "from_timestamp": 1694606400.0,
-            "end_timestamp": 1694635200.0
-        },
-        {
-            "date": "2024-09-13",
-            "worker": "15020309",
-            "from_timestamp": 1694606400.0,
-            "end_timestamp": 1694635200.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15014209",
-            "from_timestamp": 1694692800.0,
-            "end_timestamp": 1694721600.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15014212",
-            "from_timestamp": 1694692800.0,
-            "end_timestamp": 1694721600.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15015652",
-            "from_timestamp": 1694692800.0,
-            "end_timestamp": 1694721600.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15015653",
-            "from_timestamp": 1694692800.0,
-            "end_timestamp": 1694721600.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15004479",
-            "from_timestamp": 1694692800.0,
-            "end_timestamp": 1694721600.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15016112",
-            "from_timestamp": 1694692800.0,
-            "end_timestamp": 1694721600.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15016633",
-            "from_timestamp": 1694692800.0,
-            "end_timestamp": 1694721600.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15009935",
-            "from_timestamp": 1694692800.0,
-            "end_timestamp": 1694721600.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15028786",
-            "from_timestamp": 1694692800.0,
-            "end_timestamp": 1694721600.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15028837",
-            "from_timestamp": 1694692800.0,
-            "end_timestamp": 1694721600.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15097932",
-            "from_timestamp": 1694692800.0,
-            "end_timestamp": 1694721600.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15013130",
-            "from_timestamp": 1694692800.0,
-            "end_timestamp": 1694721600.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15013533",
-            "from_timestamp": 1694692800.0,
-            "end_timestamp": 1694721600.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15013870",
-            "from_timestamp": 1694692800.0,
-            "end_timestamp": 1694721600.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15015610",
-            "from_timestamp": 1694692800.0,
-            "end_timestamp": 1694721600.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15017042",
-            "from_timestamp": 1694692800.0,
-            "end_timestamp": 1694721600.0
-        },
-        {
-            "date": "2024-09-14",
-            "worker": "15020309",
-            "from_timestamp": 1694692800.0,
-            "end_timestamp": 1694721600.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15014209",
-            "from_timestamp": 1694779200.0,
-            "end_timestamp": 1694808000.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15014212",
-            "from_timestamp": 1694779200.0,
-            "end_timestamp": 1694808000.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15015652",
-            "from_timestamp": 1694779200.0,
-            "end_timestamp": 1694808000.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15015653",
-            "from_timestamp": 1694779200.0,
-            "end_timestamp": 1694808000.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15004479",
-            "from_timestamp": 1694779200.0,
-            "end_timestamp": 1694808000.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15016112",
-            "from_timestamp": 1694779200.0,
-            "end_timestamp": 1694808000.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15016633",
-            "from_timestamp": 1694779200.0,
-            "end_timestamp": 1694808000.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15009935",
-            "from_timestamp": 1694779200.0,
-            "end_timestamp": 1694808000.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15028786",
-            "from_timestamp": 1694779200.0,
-            "end_timestamp": 1694808000.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15028837",
-            "from_timestamp": 1694779200.0,
-            "end_timestamp": 1694808000.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15097932",
-            "from_timestamp": 1694779200.0,
-            "end_timestamp": 1694808000.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15013130",
-            "from_timestamp": 1694779200.0,
-            "end_timestamp": 1694808000.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15013533",
-            "from_timestamp": 1694779200.0,
-            "end_timestamp": 1694808000.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15013870",
-            "from_timestamp": 1694779200.0,
-            "end_timestamp": 1694808000.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15015610",
-            "from_timestamp": 1694779200.0,
-            "end_timestamp": 1694808000.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15017042",
-            "from_timestamp": 1694779200.0,
-            "end_timestamp": 1694808000.0
-        },
-        {
-            "date": "2024-09-15",
-            "worker": "15020309",
-            "from_timestamp": 1694779200.0,
-            "end_timestamp": 1694808000.0
-        }
-    ])
+                                example=SWAGGER_EXAMPLES['human_factor']),
+    'availabilities': fields.List(fields.Nested(availabilities_model), required=True,
+                                  description="Availability details for workers.",
+                                  example=SWAGGER_EXAMPLES['availabilities'])
+})
+
+# Models of the responses. They only document the responses, the handlers return plain dicts that are serialized
+# with orjson (see output_json), marshalling them with flask-restx would be slower
+order_to_line_solution_model = api.model('OrderToLineSolution', {
+    'Task': fields.String(example="SEV - 35", description="Order identifier"),
+    'Start': fields.Integer(example=21, description="Start of the order [h] relative to start_time_stamp"),
+    'Finish': fields.Integer(example=52, description="End of the order [h] relative to start_time_stamp"),
+    'Resource': fields.String(example="Line 20", description="Production line the order is allocated to")
+})
+
+worker_assignment_solution_model = api.inherit('WorkerAssignmentSolution', order_to_line_solution_model, {
+    'geometry': fields.String(example="468634640", description="Geometry of the order"),
+    'required_workers': fields.Integer(example=4, description="Number of workers required for the geometry"),
+    'workers': fields.List(fields.Integer, example=[1, 2, 3, 4], description="Workers assigned to the line")
+})
+
+order_to_line_response_model = api.model('OrderToLineResponse', {
+    'message': fields.String(description="Status message"),
+    'solution': fields.List(fields.Nested(order_to_line_solution_model), description="Orders allocated to lines")
+})
+
+worker_assignment_response_model = api.model('WorkerAssignmentResponse', {
+    'message': fields.String(description="Status message"),
+    'solution': fields.List(fields.Nested(worker_assignment_solution_model),
+                            description="Orders allocated to lines with the assigned workers per geometry")
 })
 
 
+# The validation of flask-restx (@api.expect(..., validate=True)) walks the request body with the generic jsonschema
+# validator, which takes tens of milliseconds for the larger planning data sets. Instead, the JSON schema of the request
+# body model is compiled into a specialized validator once.
+_validate_request_body = fastjsonschema.compile({
+    **request_body_model.__schema__,
+    'definitions': {name: model.__schema__ for name, model in api.models.items()}
+})
+
+
+def validate_request_body(data: dict, path: tuple[str, ...] = ()) -> None:
+    """
+    Validate a request body against request_body_model and abort with a 400 response in the format of flask-restx if it
+    is invalid. The errors are keyed by the path of the invalid field like in flask-restx, and missing properties get
+    the same messages. Unlike flask-restx, only the first error is reported and the other messages are the ones of
+    fastjsonschema (e.g. 'order-data[1].amount must be integer').
+
+    Parameters:
+    - data (dict): The request body.
+    - path (tuple of str): The path of the request body within the payload, prepended to the path of the error.
+    """
+    try:
+        _validate_request_body(data)
+    except fastjsonschema.JsonSchemaValueException as error:
+        # the first entry of the path is the name of the root object ('data'), which is not part of the payload
+        error_path = (*path, *error.path[1:])
+        if error.rule == 'required':
+            # like flask-restx, report every missing property under its own path
+            errors = {
+                ".".join((*error_path, name)): f"'{name}' is a required property"
+                for name in error.rule_definition if name not in error.value
+            }
+        else:
+            errors = {".".join(error_path): error.message.removeprefix("data").lstrip(". ")}
+        api.abort(HTTPStatus.BAD_REQUEST, "Input payload validation failed", errors=errors)
+
+
 # Define the resource and parameters
 # API for worker assignment
 @api.route('/worker-assignment')
 class WorkerAssignment(Resource):
     @api.doc('worker_allocation')
-    @api.expect(request_body_model, validate=True)
-    @api.response(200, 'Successfully processed the planning data.')
+    @api.expect(request_body_model)
+    @api.response(200, 'Successfully processed the planning data.', worker_assignment_response_model)
+    @api.response(304, 'The response matches the ETag of the If-None-Match header.')
     @api.response(400, 'Invalid input data.')
     def post(self):
-        # Here you would process the planning data
-        data = request.json
-        print(data)  # This will print the received JSON data to the console
-
-        # Accessing specific fields from the JSON
-        start_time_timestamp = data.get('start_time_stamp')
-        print(start_time_timestamp)
-        # Accessing order_data
-        order_data = data.get('order-data')
-        print(order_data)
-        # Store the values for each order in order_list like: (duration [h], line_id, priority, due_date [h])
-        order_list = []
-        # order_dict to uniquely identify the order based on id
-        order_dict = {}
-        order_map = {}
-        temp_order_map = {}
-        temp = 0
-
-        init_line_list = {}
-        temp_line_list = {}
-        tp_mapping = data.get('throughput_mapping')
-        for tp in tp_mapping:
-            if tp['line'] not in init_line_list:
-                init_line_list[tp['line']] = temp
-                temp_line_list['Line ' + str(temp)] = tp['line']
-                temp = temp + 1
-
-        temp = 0
-        for to in order_data:
-            if to['order'] not in temp_order_map:
-                temp_order_map[to['order']] = temp
-                order_map['Order ' + str(temp)] = to['order']
-                temp = temp + 1
-
-        temp = 0
-        for order in order_data:
-            if order['order'] not in order_dict:
-                order_dict[order['order']] = []  # if order is not in the dictionary we create an enry for it
-            priority = 0
-            if not order['priority']:
-                priority = 1
-            # Convert the time into seconds format
-            deadline_timestamp = order["deadline"]
-            duration_seconds = deadline_timestamp - start_time_timestamp
-
-            # Convert seconds to mins
-            duration_mins = duration_seconds / 60
-
-            # Use the geometry_line_mapping to identify the available lines for the given order
-            geometry_line_mapping = data.get('geometry_line_mapping')
-            line_list = []
-            for geometry in geometry_line_mapping:
-                if geometry['geometry'] == order['geometry']:
-                    line_list.append(geometry['main_line'])  # add the possible line for the order to the line list.
-                    line_list.extend(geometry['alternative_lines'])
-
-            # Iterate through the throughput mapping list and find the entry for which
-            # line and geometry match with the order
-            throughput_mapping_list = data.get('throughput_mapping')
-            for throughput_mapping in throughput_mapping_list:
-                temp = 0
-                for line in line_list:
-                    if throughput_mapping['line'] == "Line " + str(line) and throughput_mapping['geometry'] == order['geometry']:
-                        if throughput_mapping['throughput'] == 0:
-                            warnings.warn("Throughput adjusted to 300")
-                            throughput_mapping['throughput'] = 300
-                        duration = ((5 * order['mold']) + (
-                                15 + (order['amount'] / throughput_mapping['throughput'])) / 60)
-                        # add the entry (duration [h], line_id, priority, due_date [h])
-                        # to the order_dict for the given order
-                        if init_line_list[throughput_mapping['line']]:
-                            temp = init_line_list[throughput_mapping['line']]
-                        order_dict[order['order']].append(
-                            (math.ceil(duration), temp, priority, math.ceil(duration_mins)))
-                    temp = 0
-        for key, value in order_dict.items():
-            if value:
-                order_list.append(value)
-
-        # Replace the hard coded EXAMPLE_ORDER_INSTANCE with the order list generated in the previous step
-        # and call the function main() from cp_order_to_line
-        solution_df = main(order_list=order_list)
-        print(solution_df.head(n=30))
-        solution_dict = solution_df.to_dict(orient='records')
-
-        order_to_line = solution_dict
-        print(order_list)
-        worker_specific_data = {}
-        human_factor = data.get('human_factor')
-        worker_list = []
-
-        # Extract the worker ids and store them in a list
-        for factor in human_factor:
-            worker_list.append(factor['worker'])
-        index = 1
-
-        # Iterate through the workers and store the
-        # "experience" "preference" "resilience" and "medical-condition" for each worker
-        worker_map = {}
-        for worker in worker_list:
-            if int(worker) not in worker_map:
-                worker_map[int(worker)] = index
-                worker_specific_data[index] = {}
-                index = index + 1
-            for factor in human_factor:
-                if worker == factor['worker']:
-                    worker_specific_data[worker_map[int(worker)]][factor['geometry']] = {}
-                    medical_condition = True
-                    if factor['medical_condition'] == False:
-                        medical_condition = False
-                    new_data = {
-                        "experience": factor['experience'],
-                        "preference": factor['preference'],
-                        "resilience": factor['resilience'],
-                        "medical-condition": medical_condition
-                    }
-                    worker_specific_data[worker_map[int(worker)]][factor['geometry']] = new_data
-
-        print(order_list)
-
-        # Retrieve all orders and map them in the format "Order i" where i is the index for a unique order
-        order_details = {}
-        order_list = data.get('order-data')
-        order_dicts = {}
-        temp = 0
-
-        for order in order_list:
-            if order['order'] not in order_dicts:
-                order_dicts[order['order']] = temp
-                temp = temp + 1
-            order_val = "Order " + str(order_dicts[order['order']])
-            if order_val not in order_details:
-                order_details[order_val] = []
-            order_details[order_val].append(order['geometry'])
-
-        # Create the required_workers_mapping by mapping the Line with geometry and required number of workers
-        # (see required_workers_mapping in cp_worker_allocation)
-        geometry_worker_count = {}
-        geometry_line = data.get('geometry_line_mapping')
-
-        for items in geometry_line:
-            geometry_worker_count[items['geometry']] = items['number_of_workers']
-
-        required_workers_mapping = {}
-        throughput_mapping_lists = data.get('throughput_mapping')
-        for items in throughput_mapping_lists:
-            if items['line'] not in required_workers_mapping:
-                required_workers_mapping[items['line']] = {}
-            geometry_val = {items['geometry']: geometry_worker_count[items['geometry']]}
-            # For each line we append geometry and required number of workers
-            required_workers_mapping[items['line']].update(geometry_val)
-
-        # Create a mapping for each line number with Line 0, Line 1, Line 2 ....
-        line_mapping = {}
-        temp_required_workers_mapping = {}
-        temp = 0
-        for key, value in required_workers_mapping.items():
-            temp_line = "Line " + str(temp)
-            temp = temp + 1
-            temp_required_workers_mapping[temp_line] = value
-            line_mapping[temp_line] = key
-        required_workers_mapping = temp_required_workers_mapping
-
-        # Retrieve the worker availabilities
-        availabilities = data.get('availabilities')
-        worker_availabilities = []
-        # Transform the worker availabilities into tuple format
-        for availability in availabilities:
-            worker_id = availability["worker"].split()[-1]  # Extract worker ID (assuming format "worker <id>")
-
-            # Assume the from_time and end_time is relative to start_time_timestamp
-            from_timestamp = start_time_timestamp + availability["from_timestamp"]
-            end_timestamp = start_time_timestamp + availability["end_timestamp"]
-
-            # Calculate relative times in hours, rounded up
-            from_relative = math.floor((from_timestamp - start_time_timestamp) / 3600)  # Rounded down
-            end_relative = math.ceil((end_timestamp - start_time_timestamp) / 3600)  # Rounded up
-
-            # Ensure values are natural numbers
-            from_relative = max(0, from_relative)
-            end_relative = max(0, end_relative)
-
-            temps = 0
-            for worker in worker_availabilities:
-                if worker['Worker_id'] == worker_map[int(worker_id)]:
-                    temps = 1
-                    worker["availability"].append((from_relative, end_relative))
-                    break
-
-            # Append worker availability as tuple
-            if temps == 0:
-                worker_availabilities.append({
-                    "Worker_id": worker_map[int(worker_id)],
-                    "availability": [(from_relative, end_relative)]
-                })
-
-        # Hard coded worker_availabilities example not to be used
-        #worker_availabilities = [
-            #    # first shift
-        #    {'Worker_id': 1, "availability": [(0, 7), (16, 23), (32, 39), (48, 55), (64, 71)]},
-        #]
-
-        # For each task (Order) in the result obtained from order_to_line, we add the list of possible geometries
-        # see hardcoded order_details in cp_worker_allocation.py for more information
-        line_allocation = []
-        for order in order_to_line:
-            geo_list = order_details[order['Task']]
-            for geo in geo_list:
-                temp_order = order
-                temp_order['geometry'] = geo
-                try:
-                    if required_workers_mapping[order['Resource']][temp_order['geometry']]:
-                        temp_order['required_workers'] = required_workers_mapping[order['Resource']][
-                            temp_order['geometry']]
-                        line_allocation.append(temp_order)
-                except KeyError:
-                    # Handle missing key, e.g., skip or log an error
-                    pass
-
-        #    order['required_workers'] = required_workers_mapping[order['Resource']][order['geometry']]
-        # line_allocation_with_geometry_and_required_workers = extend_line_allocation_with_geometry_and_required_workers(
-        #    order_to_line
-
-        # We perform the worker_allocation by running the solver
-        allocation_list = main_allocation(
-            line_data=line_allocation,
-            worker_specific_data=worker_specific_data,
-            worker_availabilities=worker_availabilities)
-
-        # Extract the results and convert into the desired output format
-        for items in line_allocation:
-            if items['Resource'] in allocation_list:
-                temp_worker_allocation_data = allocation_list[items['Resource']]
-                worker_allocation_data = []
-                for i in temp_worker_allocation_data:
-                    # append 100000 to stick to the given worker list format but can be removed later
-                    worker_allocation_data.append(i)
-                items['workers'] = worker_allocation_data
-            else:
-                items['workers'] = []
-
-
-
-        final_result = []
-        for solution in line_allocation:
-            temp_sol = solution.copy()
-            if temp_sol['Resource'] in temp_line_list:
-                temp_sol['Resource'] = temp_line_list[temp_sol['Resource']]
-            if temp_sol['Task'] in order_map:
-                temp_sol['Task'] = order_map[temp_sol['Task']]
-            final_result.append(temp_sol)
-
-        message = "Successfully performed worker allocation operation."
-        if len(line_allocation) == 0:
-            message = "No Optimal / Feasible solution found!!"
-
-        return {
-            "message": message,
-            "solution": final_result  # Final result
-        }, 200
+        data = request.get_json()
+        log.debug("received planning data: %s", data)
+        validate_request_body(data)
+        return conditional_response(*cached_response(worker_assignment, data))
 
 
 @api.route('/order-to-line')
 class WorkerAssignment(Resource):
     @api.doc('order_scheduling')
-    @api.expect(request_body_model, validate=True)
-    @api.response(200, 'Successfully processed the planning data.')
+    @api.expect(request_body_model)
+    @api.response(200, 'Successfully processed the planning data.', order_to_line_response_model)
+    @api.response(304, 'The response matches the ETag of the If-None-Match header.')
+    @api.response(400, 'Invalid input data.')
+    def post(self):
+        data = request.get_json()
+        log.debug("received planning data: %s", data)
+        validate_request_body(data)
+        return conditional_response(*cached_response(order_to_line, data))
+
+
+# API for the worker assignment of several planning data sets at once
+@api.route('/worker-assignment/batch')
+class WorkerAssignmentBatch(Resource):
+    @api.doc('worker_allocation_batch')
+    @api.expect([request_body_model])
+    @api.response(200, 'Successfully processed the planning data.', [worker_assignment_response_model])
     @api.response(400, 'Invalid input data.')
     def post(self):
-        # Here you would process the planning data
-        data = request.json
-        print(data)  # This will print the received JSON data to the console
-
-        # Accessing specific fields from the JSON
-        start_time_timestamp = data.get('start_time_stamp')
-        print(start_time_timestamp)
-        # Accessing order_data
-        order_data = data.get('order-data')
-        print(order_data)
-        # Store the values for each order in order_list like: (duration [h], line_id, priority, due_date [h])
-        order_list = []
-        # order_dict to uniquely identify the order based on id
-        order_dict = {}
-        order_map = {}
-        temp_order_map = {}
-        temp = 0
-
-        init_line_list = {}
-        temp_line_list = {}
-        tp_mapping = data.get('throughput_mapping')
-        for tp in tp_mapping:
-            if tp['line'] not in init_line_list:
-                init_line_list[tp['line']] = temp
-                temp_line_list['Line ' + str(temp)] = tp['line']
-                temp = temp + 1
-
-        temp = 0
-        for to in order_data:
-            if to['order'] not in temp_order_map:
-                temp_order_map[to['order']] = temp
-                order_map['Order ' + str(temp)] = to['order']
-                temp = temp + 1
-
-        temp = 0
-        for order in order_data:
-            if order['order'] not in order_dict:
-                order_dict[order['order']] = []  # if order is not in the dictionary we create an enry for it
-            priority = 0
-            if not order['priority']:
-                priority = 1
-            # Convert the time into seconds format
-            deadline_timestamp = order["deadline"]
-            duration_seconds = deadline_timestamp - start_time_timestamp
-
-            # Convert seconds to mins
-            duration_mins = duration_seconds / 60
-
-            # Use the geometry_line_mapping to identify the available lines for the given order
-            geometry_line_mapping = data.get('geometry_line_mapping')
-            line_list = []
-            for geometry in geometry_line_mapping:
-                if geometry['geometry'] == order['geometry']:
-                    line_list.append(geometry['main_line'])  # add the possible line for the order to the line list.
-                    line_list.extend(geometry['alternative_lines'])
-
-            # Iterate through the throughput mapping list and find the entry for which
-            # line and geometry match with the order
-            throughput_mapping_list = data.get('throughput_mapping')
-            for throughput_mapping in throughput_mapping_list:
-                temp = 0
-                for line in line_list:
-                    if throughput_mapping['line'] == "Line " + str(line) and throughput_mapping['geometry'] == order['geometry']:
-                        if throughput_mapping['throughput'] == 0:
-                            warnings.warn("Throughput adjusted to 300")
-                            throughput_mapping['throughput'] = 300
-                        duration = ((5 * order['mold']) + (
-                                15 + (order['amount'] / throughput_mapping['throughput'])) / 60)
-                        # add the entry (duration [h], line_id, priority, due_date [h])
-                        # to the order_dict for the given order
-                        if init_line_list[throughput_mapping['line']]:
-                            temp = init_line_list[throughput_mapping['line']]
-                        order_dict[order['order']].append(
-                            (math.ceil(duration), temp, priority, math.ceil(duration_mins)))
-                    temp = 0
-        for key, value in order_dict.items():
-            if value:
-                order_list.append(value)
-
-        # Replace the hard coded EXAMPLE_ORDER_INSTANCE with the order list generated in the previous step
-        # and call the function main() from cp_order_to_line
-        solution_df = main(order_list=order_list)
-        print(solution_df.head(n=30))
-        solution_dict = solution_df.to_dict(orient='records')
-
-        final_result = []
-        for solution in solution_dict:
-            temp_sol = solution.copy()
-            if temp_sol['Resource'] in temp_line_list:
-                temp_sol['Resource'] = temp_line_list[temp_sol['Resource']]
-            if temp_sol['Task'] in order_map:
-                temp_sol['Task'] = order_map[temp_sol['Task']]
-            final_result.append(temp_sol)
-        print(order_list)
-        return {
-            "message": "Successfully performed order-to-line operation.",
-            "solution": final_result  # Include solution_dict in the response
-        }, 200
+        data = request.get_json()
+        # a single planning data set is treated as a batch of one
+        batch = data if isinstance(data, list) else [data]
+        log.debug("received %s planning data sets", len(batch))
+        for index, body in enumerate(batch):
+            # the errors are reported with the index of the planning data set, e.g. '2.human_factor'
+            validate_request_body(body, path=(str(index),))
+
+        # identical planning data sets are only solved once, the other ones are solved in parallel.
+        # The BATCH_CORES are split between the parallel solves, so that the batch does not start more search workers
+        # than there are cores. CPSAT_WORKERS still caps the search workers of each solve.
+        keys = [request_digest(worker_assignment.__name__, body) for body in batch]
+        unique = dict(zip(reversed(keys), reversed(batch)))
+        parallel_solves = max(1, min(len(unique), BATCH_CORES))
+        num_workers = max(1, BATCH_CORES // parallel_solves)
+        if CPSAT_WORKERS:
+            num_workers = min(num_workers, CPSAT_WORKERS)
+        with ThreadPoolExecutor(max_workers=parallel_solves) as executor:
+            futures = {
+                key: executor.submit(cached_response, worker_assignment, body, num_workers)
+                for key, body in unique.items()
+            }
+            responses = {key: future.result()[0] for key, future in futures.items()}
+
+        # return the responses in the order of the planning data sets
+        return [responses[key] for key in keys], 200
+
+
+def warm_up_solvers() -> None:
+    """
+    Solve a trivial instance with both solvers, so that the first request does not pay for loading OR-Tools.
+    """
+    try:
+        main(order_list=[[(1, 0, 0, 1)]])
+        main_allocation(
+            line_data=[{'Task': 'Order 0', 'Start': 0, 'Finish': 1, 'Resource': 'Line 0', 'geometry': 'geo1',
+                        'required_workers': 1}],
+            worker_specific_data={
+                1: {'geo1': {"experience": 1.0, "preference": 1.0, "resilience": 1.0, "medical-condition": True}}
+            },
+            worker_availabilities=[{'Worker_id': 1, "availability": [(0, 1)]}])
+    except Exception:
+        log.warning("Warm-up of the solvers failed", exc_info=True)
 
 
 if __name__ == '__main__':
+    warm_up_solvers()
     app.run(debug=True, use_reloader=False)
@@ -78,7 +78,8 @@ class SolutionPrinter(cp_model.CpSolverSolutionCallback):
         self.__solution_count += 1
 
 
-def main(makespan_weight: int = 1, tardiness_weight: int = 1, hours_per_day: int = 16,  order_list: List[Any] = None) -> pandas.DataFrame:
+def main(makespan_weight: int = 1, tardiness_weight: int = 1, hours_per_day: int = 16,  order_list: List[Any] = None,
+         num_workers: int = 0) -> pandas.DataFrame:
     log.info("Running main function")
     log.info(f"makespan_weight: {makespan_weight}, tardiness_weight: {tardiness_weight}")
 
@@ -205,6 +206,8 @@ def main(makespan_weight: int = 1, tardiness_weight: int = 1, hours_per_day: int
 
     # Solve model.
     solver = cp_model.CpSolver()
+    # number of parallel search workers, 0 lets CP-SAT use all available cores
+    solver.parameters.num_workers = num_workers
     solution_printer = SolutionPrinter()
     status = solver.solve(model, solution_printer)
 
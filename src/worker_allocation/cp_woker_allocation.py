@@ -89,7 +89,7 @@ def extend_line_allocation_with_geometry_and_required_workers(line_allocation: l
 
 def main_allocation(line_data: list[dict], worker_specific_data: dict, worker_availabilities: list[dict],
          preference_weight: int = 1, experience_weight: int = 1, resistance_weight: int = 1,
-         staffing_weight: int = 1) -> dict[str, list[Any]]:
+         staffing_weight: int = 1, num_workers: int = 0) -> dict[str, list[Any]]:
     model = cp_model.CpModel()
 
     makespan = max([order['Finish'] for order in line_data])
@@ -124,6 +124,22 @@ def main_allocation(line_data: list[dict], worker_specific_data: dict, worker_av
     }
     n_workers = len(worker_specific_data)
 
+    # scale the resilience, preference and experience of each worker for each geometry to integers once,
+    # instead of for every interval and line
+    scaled_worker_scores = {
+        worker_id: {
+            geometry: (int(values['resilience'] * 100), int(values['preference'] * 100),
+                       int(values['experience'] * 100))
+            for geometry, values in worker_data.items()
+        }
+        for worker_id, worker_data in worker_specific_data.items()
+    }
+    # the geometries each worker is allowed to work on due to their medical condition
+    medically_eligible_geometries = {
+        worker_id: {geometry for geometry, values in worker_data.items() if values['medical-condition']}
+        for worker_id, worker_data in worker_specific_data.items()
+    }
+
     interval_bounds = set()
 
     for order_record_in_line_allocation_df in line_data:
@@ -224,6 +240,16 @@ def main_allocation(line_data: list[dict], worker_specific_data: dict, worker_av
                     # for the cp program this means that w_line_interval is enforced to be 0
                     continue
 
+                # look up the geometry that is handled in the line in this interval
+                geometry = line_details_within_interval[line_name]['geometry']
+
+                # CONSTRAINT: worker availability and medical condition
+                # if the worker is not available in the interval or the medical condition of the worker does not allow
+                # to work on the geometry (workers without data for the geometry are not eligible), w_line_interval would
+                # be enforced to be 0. So the variable is not created at all, which keeps the model smaller
+                if not worker_is_present or geometry not in medically_eligible_geometries[worker_id]:
+                    continue
+
                 w_line_interval = model.new_bool_var(
                     f"w_{worker_id}_{interval_start}_{interval_end}_{line_name.replace(' ', '_')}")
                 # add the variable to the assignment_possibilities
@@ -233,21 +259,12 @@ def main_allocation(line_data: list[dict], worker_specific_data: dict, worker_av
                 # to enforce the minimum number of workers on the line later
                 line_details_within_interval[line_name]["w_line_interval"].append(w_line_interval)
 
-                # look up the geometry that is handled in the line in this interval
-                geometry = line_details_within_interval[line_name]['geometry']
-
                 # look up the resilience, preference and experience of the worker for the geometry of the line
-                worker_specific_data_for_worker = worker_specific_data[worker_id]
+                # (the worker is medically eligible for it, so there is data for the geometry)
                 interval_length = interval_end - interval_start
 
-                try:
-                    resilience = int(worker_specific_data_for_worker[geometry]['resilience'] * 100) * interval_length
-                    preference = int(worker_specific_data_for_worker[geometry]['preference'] * 100) * interval_length
-                    experience = int(worker_specific_data_for_worker[geometry]['experience'] * 100) * interval_length
-                except KeyError:
-                    resilience = 0
-                    preference = 0
-                    experience = 0
+                resilience, preference, experience = (
+                    score * interval_length for score in scaled_worker_scores[worker_id][geometry])
                 # set the resilience, preference and experience variables to the values of the worker
                 # if the worker is assigned to the line
                 model.Add(w_resilience == resilience).only_enforce_if(w_line_interval)
@@ -257,16 +274,6 @@ def main_allocation(line_data: list[dict], worker_specific_data: dict, worker_av
                 cp_id_of_line = cp_ids_of_lines[line_name]
                 model.Add(w_allocation == cp_id_of_line).only_enforce_if(w_line_interval)
 
-                # CONSTRAINT: medical condition
-                # check the medical condition of the worker
-                # if it is false the worker is not allowed to work on the line
-                # for the cp program this means that w_line_interval is enforced to be 0
-                try:
-                    if not worker_specific_data_for_worker[geometry]['medical-condition']:
-                        model.Add(w_line_interval == 0)
-                except KeyError:
-                    model.Add(w_line_interval == 0)
-
             # enforce that only one of the assignment_possibilities can be 1
             model.AddExactlyOne(assignment_possibilities)
 
@@ -318,6 +325,8 @@ def main_allocation(line_data: list[dict], worker_specific_data: dict, worker_av
 
     # Solve model.
     solver = cp_model.CpSolver()
+    # number of parallel search workers, 0 lets CP-SAT use all available cores
+    solver.parameters.num_workers = num_workers
     status = solver.solve(model)
     workers_list = {}
     # return if no solution was found
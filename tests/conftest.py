@@ -0,0 +1,69 @@
+import collections
+
+import pandas
+import pytest
+
+from api import swagger_api
+
+
+def _planning_data(order: str = "A", amount: int = 100) -> dict:
+    # a minimal valid request body: one order of geometry g1 that can be produced on Line 1 by worker 1
+    return {
+        "start_time_stamp": 0,
+        "order-data": [
+            {"order": order, "geometry": "g1", "amount": amount, "deadline": 36000, "mold": 1, "priority": True},
+        ],
+        "geometry_line_mapping": [
+            {"geometry": "g1", "main_line": 1, "alternative_lines": [], "number_of_workers": 1},
+        ],
+        "throughput_mapping": [
+            {"line": "Line 1", "geometry": "g1", "throughput": 100},
+        ],
+        "human_factor": [
+            {"geometry": "g1", "preference": 0.5, "resilience": 0.5, "medical_condition": True, "experience": 0.5,
+             "worker": "1"},
+        ],
+        "availabilities": [
+            {"date": "2024-01-01", "from_timestamp": 0, "end_timestamp": 36000, "worker": "worker 1"},
+        ],
+    }
+
+
+@pytest.fixture
+def make_planning_data():
+    """
+    Return a function that builds a minimal valid request body for an order with the given name and amount.
+    """
+    return _planning_data
+
+
+@pytest.fixture
+def solver_calls(monkeypatch):
+    """
+    Replace both CP-SAT solvers with stubs that schedule every order on its first alternative, and return the
+    planning data each stub was called with. The caches of previous tests are cleared.
+    """
+    calls = {"main": [], "main_allocation": []}
+
+    def main(order_list, num_workers=0):
+        calls["main"].append(order_list)
+        return pandas.DataFrame([
+            {"Task": f"Order {index}", "Start": 0, "Finish": alternatives[0][0], "Resource": f"Line {alternatives[0][1]}"}
+            for index, alternatives in enumerate(order_list)
+        ])
+
+    def main_allocation(line_data, worker_specific_data, worker_availabilities, num_workers=0):
+        calls["main_allocation"].append(line_data)
+        return {line["Resource"]: [1] for line in line_data}
+
+    monkeypatch.setattr(swagger_api, "main", main)
+    monkeypatch.setattr(swagger_api, "main_allocation", main_allocation)
+    monkeypatch.setattr(swagger_api, "_response_cache", collections.OrderedDict())
+    swagger_api._cached_order_to_line_solution.cache_clear()
+    yield calls
+    swagger_api._cached_order_to_line_solution.cache_clear()
+
+
+@pytest.fixture
+def client():
+    return swagger_api.app.test_client()
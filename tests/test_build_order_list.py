@@ -0,0 +1,50 @@
+from api.swagger_api import build_order_list
+
+
+def test_build_order_list_keeps_order_numbering_with_interleaved_rows():
+    # order A is listed before order B, but its first row has a geometry without any line
+    data = {
+        "start_time_stamp": 0,
+        "order-data": [
+            {"order": "A", "geometry": "no-line", "amount": 100, "deadline": 36000, "mold": 1, "priority": False},
+            {"order": "B", "geometry": "g1", "amount": 100, "deadline": 36000, "mold": 5, "priority": False},
+            {"order": "A", "geometry": "g2", "amount": 100, "deadline": 36000, "mold": 1, "priority": False},
+        ],
+        "geometry_line_mapping": [
+            {"geometry": "g1", "main_line": 1, "alternative_lines": [], "number_of_workers": 1},
+            {"geometry": "g2", "main_line": 2, "alternative_lines": [], "number_of_workers": 1},
+        ],
+        "throughput_mapping": [
+            {"line": "Line 1", "geometry": "g1", "throughput": 100},
+            {"line": "Line 2", "geometry": "g2", "throughput": 100},
+        ],
+    }
+    order_list, line_names, order_names, order_details = build_order_list(data)
+
+    assert order_names == {"Order 0": "A", "Order 1": "B"}
+    assert order_details == {"Order 0": ["no-line", "g2"], "Order 1": ["g1"]}
+    assert line_names == {"Line 0": "Line 1", "Line 1": "Line 2"}
+    # (duration [h], line_id, priority, due_date [h]) per order, in the 'Order i' numbering
+    assert order_list == [[(6, 1, 1, 600)], [(26, 0, 1, 600)]]
+
+
+def test_build_order_list_skips_orders_without_line():
+    data = {
+        "start_time_stamp": 0,
+        "order-data": [
+            {"order": "A", "geometry": "no-line", "amount": 100, "deadline": 36000, "mold": 1, "priority": True},
+            {"order": "B", "geometry": "g1", "amount": 100, "deadline": 36000, "mold": 1, "priority": True},
+        ],
+        "geometry_line_mapping": [
+            {"geometry": "g1", "main_line": 1, "alternative_lines": [], "number_of_workers": 1},
+        ],
+        "throughput_mapping": [
+            {"line": "Line 1", "geometry": "g1", "throughput": 100},
+        ],
+    }
+    order_list, _, order_names, order_details = build_order_list(data)
+
+    # 'Order 0' of the solver is B, A does not take up an index
+    assert order_list == [[(6, 0, 0, 600)]]
+    assert order_names == {"Order 0": "B"}
+    assert order_details == {"Order 0": ["g1"]}
@@ -0,0 +1,29 @@
+import pytest
+
+from api.swagger_api import build_worker_specific_data
+
+
+def test_build_worker_specific_data_merges_duplicate_rows():
+    human_factor = [
+        {"geometry": "g1", "preference": 0.2, "resilience": 0.4, "medical_condition": True, "experience": 0.6,
+         "worker": "7"},
+        {"geometry": "g2", "preference": 0.9, "resilience": 0.9, "medical_condition": True, "experience": 0.9,
+         "worker": "7"},
+        {"geometry": "g1", "preference": 0.4, "resilience": 0.8, "medical_condition": False, "experience": 1.0,
+         "worker": "7"},
+    ]
+
+    with pytest.warns(UserWarning, match="Merged 1 duplicate"):
+        worker_specific_data, worker_map = build_worker_specific_data(human_factor)
+
+    assert worker_map == {7: 1}
+    # the scores of duplicate rows are averaged, the worker is only medically fit if all rows say so
+    assert worker_specific_data[1]["g1"] == {
+        "experience": pytest.approx(0.8),
+        "preference": pytest.approx(0.3),
+        "resilience": pytest.approx(0.6),
+        "medical-condition": False,
+    }
+    assert worker_specific_data[1]["g2"] == {
+        "experience": 0.9, "preference": 0.9, "resilience": 0.9, "medical-condition": True,
+    }
@@ -0,0 +1,105 @@
+def test_batch_returns_the_responses_in_the_order_of_the_planning_data(client, solver_calls, make_planning_data):
+    batch = [make_planning_data("B"), make_planning_data("A"), make_planning_data("C")]
+
+    response = client.post("/worker-assignment/batch", json=batch)
+
+    assert response.status_code == 200
+    assert [result["solution"][0]["Task"] for result in response.get_json()] == ["B", "A", "C"]
+
+
+def test_batch_solves_identical_planning_data_once(client, solver_calls, make_planning_data):
+    batch = [make_planning_data("A"), make_planning_data("B"), make_planning_data("A")]
+
+    response = client.post("/worker-assignment/batch", json=batch)
+
+    assert response.status_code == 200
+    results = response.get_json()
+    assert [result["solution"][0]["Task"] for result in results] == ["A", "B", "A"]
+    assert results[0] == results[2]
+    assert len(solver_calls["main_allocation"]) == 2
+
+
+def test_batch_accepts_a_single_planning_data_set(client, solver_calls, make_planning_data):
+    response = client.post("/worker-assignment/batch", json=make_planning_data("A"))
+
+    assert response.status_code == 200
+    assert response.get_json() == [client.post("/worker-assignment", json=make_planning_data("A")).get_json()]
+
+
+def test_batch_of_nothing_returns_nothing(client, solver_calls):
+    response = client.post("/worker-assignment/batch", json=[])
+
+    assert response.status_code == 200
+    assert response.get_json() == []
+    assert solver_calls["main_allocation"] == []
+
+
+def test_missing_property_is_reported_under_its_name(client, solver_calls, make_planning_data):
+    planning_data = make_planning_data()
+    del planning_data["human_factor"]
+
+    response = client.post("/worker-assignment", json=planning_data)
+
+    assert response.status_code == 400
+    assert response.get_json()["errors"] == {"human_factor": "'human_factor' is a required property"}
+
+
+def test_invalid_nested_field_is_reported_under_its_path(client, solver_calls, make_planning_data):
+    planning_data = make_planning_data()
+    planning_data["order-data"].append({**planning_data["order-data"][0], "amount": "many"})
+
+    response = client.post("/order-to-line", json=planning_data)
+
+    assert response.status_code == 400
+    errors = response.get_json()["errors"]
+    assert list(errors) == ["order-data.1.amount"]
+    assert not errors["order-data.1.amount"].startswith("data")
+
+
+def test_invalid_batch_element_is_reported_with_its_index(client, solver_calls, make_planning_data):
+    invalid_planning_data = make_planning_data("B")
+    del invalid_planning_data["order-data"][0]["mold"]
+
+    response = client.post("/worker-assignment/batch", json=[make_planning_data("A"), invalid_planning_data])
+
+    assert response.status_code == 400
+    assert response.get_json()["errors"] == {"1.order-data.0.mold": "'mold' is a required property"}
+    assert solver_calls["main_allocation"] == []
+
+
+def test_matching_etag_gets_an_empty_not_modified(client, solver_calls, make_planning_data):
+    etag = client.post("/worker-assignment", json=make_planning_data()).headers["ETag"]
+
+    response = client.post("/worker-assignment", json=make_planning_data(), headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+
+
+def test_weak_etag_gets_a_not_modified(client, solver_calls, make_planning_data):
+    # proxies that compress the response (e.g. nginx with gzip) turn the ETag into a weak one
+    etag = client.post("/order-to-line", json=make_planning_data()).headers["ETag"]
+
+    response = client.post("/order-to-line", json=make_planning_data(), headers={"If-None-Match": "W/" + etag})
+
+    assert response.status_code == 304
+
+
+def test_non_matching_etag_gets_the_response(client, solver_calls, make_planning_data):
+    etag = client.post("/worker-assignment", json=make_planning_data()).headers["ETag"]
+
+    response = client.post("/worker-assignment", json=make_planning_data(), headers={"If-None-Match": '"other"'})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == etag
+    assert response.get_json()["solution"]
+
+
+def test_swagger_json_is_not_modified_for_a_weak_etag(client):
+    etag = client.get("/swagger.json").headers["ETag"]
+
+    response = client.get("/swagger.json", headers={"If-None-Match": "W/" + etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag